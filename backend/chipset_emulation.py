@@ -150,6 +150,32 @@ class ChipsetProfile:
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
+# Enum-valued keys of a profile dict, per section; everything else is plain data
+_PROFILE_ENUM_FIELDS = (
+    (None, ('vendor', 'architecture')),
+    ('boot_sequence', ('stage', 'next_stage')),
+    ('peripherals', ('type',)),
+)
+
+
+def _flatten_enum_fields(items: List[Dict[str, Any]], keys: tuple) -> List[Dict[str, Any]]:
+    """Replace enums stored under keys by their values, in place."""
+    for item in items:
+        for key in keys:
+            value = item.get(key)
+            if isinstance(value, Enum):
+                item[key] = value.value
+    return items
+
+
+def profile_to_dict(profile: ChipsetProfile) -> Dict[str, Any]:
+    """Convert a ChipsetProfile to a JSON-ready dict."""
+    profile_dict = asdict(profile)
+    for section, keys in _PROFILE_ENUM_FIELDS:
+        _flatten_enum_fields(profile_dict[section] if section else (profile_dict,), keys)
+    return profile_dict
+
+
 # ============================================================================
 # Chipset Profile Database
 # ============================================================================
@@ -830,7 +856,7 @@ class BootSequenceSimulatorWorker:
                 else:
                     callback({"message": message, "stage": self._current_stage})
             except Exception as e:
-                logger.warning(f"Log callback error: {e}")
+                logger.warning("Log callback error: %s", e)
 
 
 # ============================================================================
@@ -18,13 +18,15 @@ import os
 import shutil
 import subprocess
 import tempfile
-import uuid
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from secrets import token_hex
 from typing import Any, Callable, Dict, List, Optional
 
+from emulation_platform import now_iso
+
 logger = logging.getLogger("phoenix2.docker_emulator")
 
 
@@ -156,7 +158,7 @@ class DockerManagerWorker:
         cpu_cores: int = 4
     ) -> ContainerConfig:
         """Create a Docker container for board emulation."""
-        container_id = f"phoenix2_{emulator_id}_{uuid.uuid4().hex[:8]}"
+        container_id = f"phoenix2_{emulator_id}_{token_hex(4)}"
 
         # Determine base image based on architecture
         if architecture in ["aarch64", "arm64"]:
@@ -194,7 +196,7 @@ class DockerManagerWorker:
         )
 
         self.containers[container_id] = config
-        logger.info(f"Created container config: {container_id}")
+        logger.info("Created container config: %s", container_id)
 
         return config
 
@@ -280,7 +282,7 @@ class DockerManagerWorker:
                 subprocess.run(["docker", "stop", container_id], timeout=30)
                 subprocess.run(["docker", "rm", container_id], timeout=30)
             except Exception as e:
-                logger.warning(f"Error stopping container: {e}")
+                logger.warning("Error stopping container: %s", e)
 
         config.status = ContainerStatus.STOPPED
         return {"status": "stopped", "container_id": container_id}
@@ -291,9 +293,9 @@ class DockerManagerWorker:
         if callback:
             try:
                 if asyncio.iscoroutinefunction(callback):
-                    await callback({"message": message, "timestamp": datetime.now().isoformat()})
+                    await callback({"message": message, "timestamp": now_iso()})
                 else:
-                    callback({"message": message, "timestamp": datetime.now().isoformat()})
+                    callback({"message": message, "timestamp": now_iso()})
             except Exception:
                 pass
 
@@ -402,9 +404,9 @@ class FirmwareLoaderWorker:
         if callback:
             try:
                 if asyncio.iscoroutinefunction(callback):
-                    await callback({"message": message, "timestamp": datetime.now().isoformat()})
+                    await callback({"message": message, "timestamp": now_iso()})
                 else:
-                    callback({"message": message, "timestamp": datetime.now().isoformat()})
+                    callback({"message": message, "timestamp": now_iso()})
             except Exception:
                 pass
 
@@ -632,9 +634,9 @@ exit 0
         if callback:
             try:
                 if asyncio.iscoroutinefunction(callback):
-                    await callback({"message": message, "timestamp": datetime.now().isoformat()})
+                    await callback({"message": message, "timestamp": now_iso()})
                 else:
-                    callback({"message": message, "timestamp": datetime.now().isoformat()})
+                    callback({"message": message, "timestamp": now_iso()})
             except Exception:
                 pass
 
@@ -717,7 +719,7 @@ class DockerEmulationOrchestrator:
         log_callback: Optional[Callable] = None
     ) -> Dict[str, Any]:
         """Run complete Docker-based verification workflow."""
-        session_id = f"DOCKER_{uuid.uuid4().hex[:8].upper()}"
+        session_id = f"DOCKER_{token_hex(4).upper()}"
 
         try:
             # Step 1: Check Docker
@@ -801,9 +803,9 @@ class DockerEmulationOrchestrator:
         if callback:
             try:
                 if asyncio.iscoroutinefunction(callback):
-                    await callback({"message": message, "timestamp": datetime.now().isoformat()})
+                    await callback({"message": message, "timestamp": now_iso()})
                 else:
-                    callback({"message": message, "timestamp": datetime.now().isoformat()})
+                    callback({"message": message, "timestamp": now_iso()})
             except Exception:
                 pass
 
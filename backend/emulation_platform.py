@@ -21,22 +21,49 @@ AI Workers:
 """
 
 import asyncio
+import copy
 import hashlib
 import json
 import logging
 import os
 import re
-import uuid
-from dataclasses import dataclass, field, asdict
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, asdict, is_dataclass
 from datetime import datetime
 from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable
+from secrets import token_hex
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 import yaml
 import random
 
+try:
+    import fcntl
+except ImportError:  # Windows: single-process registry only
+    fcntl = None
+
 logger = logging.getLogger("phoenix2.emulation_platform")
 
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+_ts_cache: List[Any] = [0, ""]  # [epoch second, ISO string]
+
+
+def now_iso() -> str:
+    """Current time as a whole-second ISO string, re-formatted at most once per second."""
+    second = int(time.time())
+    if second != _ts_cache[0]:
+        _ts_cache[0] = second
+        _ts_cache[1] = datetime.fromtimestamp(second).isoformat()
+    return _ts_cache[1]
+
 
 # ============================================================================
 # Enums and Data Classes
@@ -62,6 +89,58 @@ class TestCategory(Enum):
     BOUNDARY = "boundary"
 
 
+_CATEGORY_MAP: Dict[str, TestCategory] = {
+    'network': TestCategory.NETWORK,
+    'networking': TestCategory.NETWORK,
+    'wifi': TestCategory.WIFI,
+    'wireless': TestCategory.WIFI,
+    'voice': TestCategory.VOICE,
+    'voip': TestCategory.VOICE,
+    'usb': TestCategory.USB,
+    'security': TestCategory.SECURITY,
+    'management': TestCategory.MANAGEMENT,
+    'boot': TestCategory.BOOT,
+    'performance': TestCategory.PERFORMANCE,
+    'stress': TestCategory.STRESS,
+    'boundary': TestCategory.BOUNDARY
+}
+
+
+def to_test_category(category: Any) -> TestCategory:
+    """Map a category string (or TestCategory) to TestCategory enum."""
+    if isinstance(category, TestCategory):
+        return category
+    return _CATEGORY_MAP.get(str(category).lower(), TestCategory.PERFORMANCE)
+
+
+def _enum_dict(items: List[tuple]) -> Dict[str, Any]:
+    """asdict() dict_factory that flattens enums to their values."""
+    return {k: (v.value if isinstance(v, Enum) else v) for k, v in items}
+
+
+def _file_sha256(path: Union[str, Path]) -> str:
+    """SHA-256 hex digest of a file, read in 1 MiB chunks."""
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _field_getter(obj: Any) -> Callable:
+    """Return a dict.get-style accessor for a dict or a dataclass instance."""
+    if type(obj) is dict:
+        return obj.get
+    return partial(getattr, obj)
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON fallback that writes enums as their values."""
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
 class TestSeverity(Enum):
     CRITICAL = "critical"
     HIGH = "high"
@@ -77,7 +156,8 @@ class EmulatorStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+# Per-item records are slotted: long runs hold thousands of them per session
+@dataclass(slots=True)
 class ParsedCapability:
     """Capability extracted from specification document."""
     id: str
@@ -90,7 +170,7 @@ class ParsedCapability:
     test_criteria: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedRequirement:
     """Requirement extracted from requirement document."""
     id: str
@@ -102,7 +182,7 @@ class ParsedRequirement:
     linked_capabilities: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedTestCase:
     """Auto-generated test case."""
     id: str
@@ -118,7 +198,7 @@ class GeneratedTestCase:
     linked_capabilities: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class EmulatorConfig:
     """Configuration for board emulator."""
     emulator_id: str
@@ -138,12 +218,12 @@ class EmulatorConfig:
     status: EmulatorStatus = EmulatorStatus.CREATED
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of a single test execution."""
     test_id: str
     test_name: str
-    category: str
+    category: TestCategory
     status: str  # passed, failed, skipped, error
     duration_sec: float
     actual_result: Any
@@ -181,11 +261,18 @@ class DocumentParserWorker:
 
     Supports: YAML, JSON, Markdown, Text files
     Extracts: Hardware capabilities, software requirements, test criteria
+
+    Parse results are kept in an LRU of futures keyed by a blake2b digest of
+    the format and content: re-uploaded specs skip parsing and extraction,
+    and concurrent uploads of the same spec share a single parse.
     """
 
+    PARSE_CACHE_SIZE = 1024
+
     def __init__(self):
         self.status = WorkerStatus.IDLE
         self.supported_formats = ['.yaml', '.yml', '.json', '.md', '.txt']
+        self._parse_cache: OrderedDict = OrderedDict()
 
     async def parse_document(self, file_path: str, content: Optional[str] = None) -> Dict[str, Any]:
         """Parse a specification or requirement document."""
@@ -200,19 +287,10 @@ class DocumentParserWorker:
 
             ext = Path(file_path).suffix.lower()
 
-            if ext in ['.yaml', '.yml']:
-                parsed = self._parse_yaml(content)
-            elif ext == '.json':
-                parsed = self._parse_json(content)
-            elif ext == '.md':
-                parsed = self._parse_markdown(content)
-            else:
-                parsed = self._parse_text(content)
-
-            # Extract capabilities and requirements
-            capabilities = self._extract_capabilities(parsed)
-            requirements = self._extract_requirements(parsed)
-            hardware_spec = self._extract_hardware_spec(parsed)
+            cache_key = self._cache_key(ext, content)
+            parsed, capabilities, requirements, hardware_spec = await self._parse_once(cache_key, ext, content)
+            # The cached parse is shared; hand each caller its own copy (asdict copies the rest)
+            parsed, hardware_spec = copy.deepcopy((parsed, hardware_spec))
 
             self.status = WorkerStatus.COMPLETED
 
@@ -223,14 +301,68 @@ class DocumentParserWorker:
                 "capabilities": [asdict(c) for c in capabilities],
                 "requirements": [asdict(r) for r in requirements],
                 "hardware_spec": hardware_spec,
-                "parse_timestamp": datetime.now().isoformat()
+                "parse_timestamp": now_iso()
             }
 
         except Exception as e:
             self.status = WorkerStatus.FAILED
-            logger.error(f"Document parse error: {e}")
+            logger.error("Document parse error: %s", e)
             raise
 
+    async def _parse_once(self, cache_key: bytes, ext: str, content: str) -> tuple:
+        """Parse off the event loop, coalescing concurrent parses of one digest.
+
+        The parse runs as its own task that every caller only awaits through
+        a shield, so cancelling one caller never cancels the shared parse or
+        the other callers waiting on it.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._parse_cache.get(cache_key)
+        if task is not None and task.done():
+            self._parse_cache.move_to_end(cache_key)
+            return task.result()
+        # A pending task from another (finished) loop can never resolve here
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(asyncio.to_thread(self._parse_content, ext, content))
+            task.add_done_callback(partial(self._evict_failed, cache_key))
+            self._parse_cache[cache_key] = task
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        else:
+            self._parse_cache.move_to_end(cache_key)
+        return await asyncio.shield(task)
+
+    def _evict_failed(self, cache_key: bytes, task: asyncio.Task):
+        """Drop a failed or cancelled parse from the cache so it is retried."""
+        if task.cancelled() or task.exception() is not None:
+            if self._parse_cache.get(cache_key) is task:
+                del self._parse_cache[cache_key]
+
+    def _cache_key(self, ext: str, content: str) -> bytes:
+        """Digest identifying a document by format and content."""
+        digest = hashlib.blake2b(ext.encode(), digest_size=16)
+        digest.update(b'\0')
+        digest.update(content.encode())
+        return digest.digest()
+
+    def _parse_content(self, ext: str, content: str) -> tuple:
+        """Parse content and extract capabilities, requirements and hardware spec."""
+        if ext in ['.yaml', '.yml']:
+            parsed = self._parse_yaml(content)
+        elif ext == '.json':
+            parsed = self._parse_json(content)
+        elif ext == '.md':
+            parsed = self._parse_markdown(content)
+        else:
+            parsed = self._parse_text(content)
+
+        # Extract capabilities and requirements
+        capabilities = self._extract_capabilities(parsed)
+        requirements = self._extract_requirements(parsed)
+        hardware_spec = self._extract_hardware_spec(parsed)
+
+        return parsed, capabilities, requirements, hardware_spec
+
     def _parse_yaml(self, content: str) -> Dict[str, Any]:
         """Parse YAML content."""
         return yaml.safe_load(content) or {}
@@ -411,7 +543,7 @@ class EmulatorGeneratorWorker:
 
         try:
             merged = self._merge_parsed_docs(parsed_docs)
-            emulator_id = custom_id or f"EMU_{uuid.uuid4().hex[:8].upper()}"
+            emulator_id = custom_id or f"EMU_{token_hex(4).upper()}"
             hw_spec = merged.get('hardware_spec', {})
 
             all_capabilities = []
@@ -442,7 +574,7 @@ class EmulatorGeneratorWorker:
                 flash_mb=hw_spec.get('flash', {}).get('size_mb', 256),
                 capabilities=all_capabilities,
                 requirements=all_requirements,
-                created_at=datetime.now().isoformat(),
+                created_at=now_iso(),
                 source_documents=[doc.get('file_path', 'unknown') for doc in parsed_docs],
                 status=EmulatorStatus.CREATED
             )
@@ -461,13 +593,13 @@ class EmulatorGeneratorWorker:
             config.status = EmulatorStatus.READY
 
             self.status = WorkerStatus.COMPLETED
-            logger.info(f"Generated emulator: {emulator_id} for {board_name}")
+            logger.info("Generated emulator: %s for %s", emulator_id, board_name)
 
             return config
 
         except Exception as e:
             self.status = WorkerStatus.FAILED
-            logger.error(f"Emulator generation failed: {e}")
+            logger.error("Emulator generation failed: %s", e)
             raise
 
     def _merge_parsed_docs(self, docs: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -510,7 +642,7 @@ class EmulatorGeneratorWorker:
                 {"host": "/tmp/phoenix2/logs", "container": "/logs", "mode": "rw"}
             ],
             "capabilities_count": len(config.capabilities),
-            "generated_at": datetime.now().isoformat()
+            "generated_at": now_iso()
         }
 
     def _config_to_dict(self, config: EmulatorConfig) -> Dict[str, Any]:
@@ -525,9 +657,9 @@ class EmulatorGeneratorWorker:
             "cpu_cores": config.cpu_cores,
             "memory_mb": config.memory_mb,
             "flash_mb": config.flash_mb,
-            "capabilities": [asdict(c) if hasattr(c, '__dataclass_fields__') else c for c in config.capabilities],
+            "capabilities": [asdict(c) if type(c) is ParsedCapability else c for c in config.capabilities],
             "requirements": [
-                {**asdict(r), 'severity': r.severity.value} if hasattr(r, '__dataclass_fields__') else r
+                asdict(r, dict_factory=_enum_dict) if type(r) is ParsedRequirement else r
                 for r in config.requirements
             ],
             "created_at": config.created_at,
@@ -559,14 +691,24 @@ class RegistryManagerWorker:
         for path in [self.emulators_path, self.tests_path, self.reports_path, self.artifacts_path]:
             path.mkdir(exist_ok=True)
 
+        self._index_file = self.registry_path / "index.json"
+        self._lock_file = self.registry_path / "index.lock"
         self._index: Dict[str, Dict[str, Any]] = {}
+        self._index_stamp: Optional[tuple] = None
         self._load_index()
 
+    def _stat_index(self) -> Optional[tuple]:
+        try:
+            st = self._index_file.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
     def _load_index(self):
         """Load registry index from disk."""
-        index_file = self.registry_path / "index.json"
-        if index_file.exists():
-            with open(index_file, 'r') as f:
+        stamp = self._stat_index()
+        if stamp is not None:
+            with open(self._index_file, 'r') as f:
                 self._index = json.load(f)
         else:
             self._index = {
@@ -575,19 +717,65 @@ class RegistryManagerWorker:
                 "reports": {},
                 "artifacts": {}
             }
-
-    def _save_index(self):
-        """Save registry index to disk."""
-        index_file = self.registry_path / "index.json"
-        with open(index_file, 'w') as f:
-            json.dump(self._index, f, indent=2)
+        self._index_stamp = stamp
+
+    def _refresh_index(self):
+        """Reload the index if another process (server worker) rewrote it."""
+        if self._stat_index() != self._index_stamp:
+            self._load_index()
+
+    @contextmanager
+    def _locked_index(self):
+        """Hold the registry lock with a fresh index; the index is saved on exit."""
+        with open(self._lock_file, 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                self._refresh_index()
+                index = self._index
+                yield index
+                self._write_json(self._index_file, index)
+                # Publish the written dict before its stamp, so a concurrent
+                # _refresh_index never pairs the new stamp with an older dict
+                self._index = index
+                self._index_stamp = self._stat_index()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _update_index(self, mutate: Callable[[Dict[str, Any]], Any]) -> Any:
+        """Locked read-modify-write of the index; returns mutate(index).
+
+        Blocking (it waits for other workers' lock and rewrites the whole
+        index), so the async register_* methods run it via asyncio.to_thread.
+        """
+        with self._locked_index() as index:
+            return mutate(index)
+
+    def _put_index_entry(self, section: str, key: str, entry: Dict[str, Any]):
+        """Store one index entry under the registry lock (blocking)."""
+        with self._locked_index() as index:
+            index[section][key] = entry
+
+    def _write_json(self, path: Path, data: Any):
+        """Write JSON in one flush and atomically swap it into place."""
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(json.dumps(data, indent=2))
+            # mkstemp creates 0600 files; keep the permissions open() would give
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
 
     async def register_emulator(self, config: EmulatorConfig) -> Dict[str, Any]:
         """Register a new emulator in the registry."""
         self.status = WorkerStatus.RUNNING
 
         try:
-            if hasattr(config, '__dataclass_fields__'):
+            if type(config) is EmulatorConfig:
                 config_dict = {
                     "emulator_id": config.emulator_id,
                     "board_name": config.board_name,
@@ -603,30 +791,35 @@ class RegistryManagerWorker:
                     "created_at": config.created_at,
                     "source_documents": config.source_documents,
                     "docker_image": config.docker_image,
-                    "status": config.status.value if hasattr(config.status, 'value') else config.status
+                    "status": config.status.value if type(config.status) is EmulatorStatus else config.status
                 }
             else:
                 config_dict = config
 
             emulator_id = config_dict['emulator_id']
-
             config_file = self.emulators_path / f"{emulator_id}.json"
-            with open(config_file, 'w') as f:
-                json.dump(config_dict, f, indent=2)
-
-            self._index["emulators"][emulator_id] = {
-                "id": emulator_id,
-                "board_name": config_dict['board_name'],
-                "soc_id": config_dict['soc_id'],
-                "vendor": config_dict['vendor'],
-                "created_at": config_dict['created_at'],
-                "capabilities_count": config_dict.get('capabilities_count', 0),
-                "status": config_dict['status'],
-                "version": 1,
-                "config_path": str(config_file)
-            }
 
-            self._save_index()
+            def add_emulator(index):
+                # Bumped on every re-registration so consumers can invalidate caches
+                previous = index["emulators"].get(emulator_id)
+                version = previous.get("version", 1) + 1 if previous else 1
+                versioned = {**config_dict, "version": version}
+
+                self._write_json(config_file, versioned)
+
+                index["emulators"][emulator_id] = {
+                    "id": emulator_id,
+                    "board_name": versioned['board_name'],
+                    "soc_id": versioned['soc_id'],
+                    "vendor": versioned['vendor'],
+                    "created_at": versioned['created_at'],
+                    "capabilities_count": versioned.get('capabilities_count', 0),
+                    "status": versioned['status'],
+                    "version": version,
+                    "config_path": str(config_file)
+                }
+
+            await asyncio.to_thread(self._update_index, add_emulator)
             self.status = WorkerStatus.COMPLETED
 
             return {
@@ -637,42 +830,38 @@ class RegistryManagerWorker:
 
         except Exception as e:
             self.status = WorkerStatus.FAILED
-            logger.error(f"Registry error: {e}")
+            logger.error("Registry error: %s", e)
             raise
 
     async def register_tests(self, emulator_id: str, tests: List[GeneratedTestCase]) -> Dict[str, Any]:
-        """Register generated test cases."""
+        """Register generated test cases; the stored dicts are returned under "tests"."""
         self.status = WorkerStatus.RUNNING
 
         try:
             tests_file = self.tests_path / f"{emulator_id}_tests.json"
-            tests_dict = [asdict(t) if hasattr(t, '__dataclass_fields__') else t for t in tests]
-
-            for t in tests_dict:
-                if 'category' in t and hasattr(t['category'], 'value'):
-                    t['category'] = t['category'].value
-                if 'severity' in t and hasattr(t['severity'], 'value'):
-                    t['severity'] = t['severity'].value
+            tests_dict = [
+                asdict(t, dict_factory=_enum_dict) if is_dataclass(t) else _enum_dict(t.items())
+                for t in tests
+            ]
 
-            with open(tests_file, 'w') as f:
-                json.dump(tests_dict, f, indent=2)
+            self._write_json(tests_file, tests_dict)
 
-            self._index["tests"][emulator_id] = {
+            entry = {
                 "emulator_id": emulator_id,
                 "test_count": len(tests),
                 "categories": list(set(t.get('category', 'unknown') for t in tests_dict)),
-                "created_at": datetime.now().isoformat(),
+                "created_at": now_iso(),
                 "tests_path": str(tests_file)
             }
-
-            self._save_index()
+            await asyncio.to_thread(self._put_index_entry, "tests", emulator_id, entry)
             self.status = WorkerStatus.COMPLETED
 
             return {
                 "status": "registered",
                 "emulator_id": emulator_id,
                 "test_count": len(tests),
-                "tests_path": str(tests_file)
+                "tests_path": str(tests_file),
+                "tests": tests_dict
             }
 
         except Exception as e:
@@ -684,14 +873,14 @@ class RegistryManagerWorker:
         self.status = WorkerStatus.RUNNING
 
         try:
-            report_dict = asdict(report) if hasattr(report, '__dataclass_fields__') else report
+            report_dict = asdict(report) if type(report) is EmulationReport else report
             report_id = report_dict['report_id']
 
             report_file = self.reports_path / f"{report_id}.json"
             with open(report_file, 'w') as f:
-                json.dump(report_dict, f, indent=2, default=str)
+                json.dump(report_dict, f, indent=2, default=_json_default)
 
-            self._index["reports"][report_id] = {
+            entry = {
                 "report_id": report_id,
                 "emulator_id": report_dict['emulator_id'],
                 "board_name": report_dict['board_name'],
@@ -699,8 +888,7 @@ class RegistryManagerWorker:
                 "timestamp": report_dict['timestamp'],
                 "report_path": str(report_file)
             }
-
-            self._save_index()
+            await asyncio.to_thread(self._put_index_entry, "reports", report_id, entry)
             self.status = WorkerStatus.COMPLETED
 
             return {
@@ -715,6 +903,7 @@ class RegistryManagerWorker:
 
     def list_emulators(self, vendor: Optional[str] = None) -> List[Dict[str, Any]]:
         """List registered emulators."""
+        self._refresh_index()
         emulators = list(self._index["emulators"].values())
         if vendor:
             emulators = [e for e in emulators if e.get('vendor', '').lower() == vendor.lower()]
@@ -722,6 +911,7 @@ class RegistryManagerWorker:
 
     def get_emulator(self, emulator_id: str) -> Optional[Dict[str, Any]]:
         """Get emulator configuration by ID."""
+        self._refresh_index()
         if emulator_id not in self._index["emulators"]:
             return None
 
@@ -731,6 +921,7 @@ class RegistryManagerWorker:
 
     def get_tests(self, emulator_id: str) -> Optional[List[Dict[str, Any]]]:
         """Get test cases for an emulator."""
+        self._refresh_index()
         if emulator_id not in self._index["tests"]:
             return None
 
@@ -740,6 +931,7 @@ class RegistryManagerWorker:
 
     def list_reports(self, emulator_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """List reports, optionally filtered by emulator."""
+        self._refresh_index()
         reports = list(self._index["reports"].values())
         if emulator_id:
             reports = [r for r in reports if r.get('emulator_id') == emulator_id]
@@ -897,13 +1089,13 @@ class BootTestGeneratorWorker:
                     test.linked_requirements = [r.id for r in boot_reqs[:2]]
 
             self.status = WorkerStatus.COMPLETED
-            logger.info(f"Generated {len(tests)} boot test cases")
+            logger.info("Generated %s boot test cases", len(tests))
 
             return tests
 
         except Exception as e:
             self.status = WorkerStatus.FAILED
-            logger.error(f"Boot test generation failed: {e}")
+            logger.error("Boot test generation failed: %s", e)
             raise
 
 
@@ -937,8 +1129,9 @@ class FeatureTestGeneratorWorker:
             if requirements is None:
                 requirements = config.requirements
 
+            req_index = self._index_requirements(requirements)
             for cap in capabilities:
-                cap_tests = self._generate_capability_tests(cap, requirements)
+                cap_tests = self._generate_capability_tests(cap, requirements, req_index)
                 tests.extend(cap_tests)
 
             for req in requirements:
@@ -948,24 +1141,50 @@ class FeatureTestGeneratorWorker:
                         tests.append(req_test)
 
             self.status = WorkerStatus.COMPLETED
-            logger.info(f"Generated {len(tests)} feature test cases")
+            logger.info("Generated %s feature test cases", len(tests))
 
             return tests
 
         except Exception as e:
             self.status = WorkerStatus.FAILED
-            logger.error(f"Feature test generation failed: {e}")
+            logger.error("Feature test generation failed: %s", e)
             raise
 
+    def _index_requirements(
+        self,
+        requirements: List[ParsedRequirement]
+    ) -> Dict[str, Any]:
+        """Pre-compute lookups shared by every capability test."""
+        by_capability: Dict[str, set] = {}
+        for i, r in enumerate(requirements):
+            for cap_id in r.linked_capabilities:
+                by_capability.setdefault(cap_id, set()).add(i)
+        return {
+            "descriptions": [r.description.lower() for r in requirements],
+            "by_capability": by_capability
+        }
+
     def _generate_capability_tests(
         self,
         cap: ParsedCapability,
-        requirements: List[ParsedRequirement]
+        requirements: List[ParsedRequirement],
+        req_index: Optional[Dict[str, Any]] = None
     ) -> List[GeneratedTestCase]:
         """Generate tests for a specific capability."""
         tests = []
         category = self._map_category(cap.category)
 
+        if req_index is None:
+            req_index = self._index_requirements(requirements)
+        cap_name = cap.name.lower()
+        linked = req_index["by_capability"].get(cap.id, ())
+        linked_requirements = []
+        for i, desc in enumerate(req_index["descriptions"]):
+            if cap_name in desc or i in linked:
+                linked_requirements.append(requirements[i].id)
+                if len(linked_requirements) == 3:
+                    break
+
         tests.append(GeneratedTestCase(
             id=f"{cap.id}_FUNC_001",
             name=f"{cap.name} - Basic Functionality",
@@ -983,16 +1202,10 @@ class FeatureTestGeneratorWorker:
                 f"{cap.name} performs expected function"
             ],
             timeout_sec=60,
+            linked_requirements=linked_requirements,
             linked_capabilities=[cap.id]
         ))
 
-        for test in tests:
-            relevant_reqs = [
-                r for r in requirements
-                if cap.name.lower() in r.description.lower() or cap.id in r.linked_capabilities
-            ]
-            test.linked_requirements = [r.id for r in relevant_reqs[:3]]
-
         return tests
 
     def _generate_requirement_test(self, req: ParsedRequirement) -> Optional[GeneratedTestCase]:
@@ -1017,22 +1230,7 @@ class FeatureTestGeneratorWorker:
 
     def _map_category(self, category: str) -> TestCategory:
         """Map string category to TestCategory enum."""
-        category_map = {
-            'network': TestCategory.NETWORK,
-            'networking': TestCategory.NETWORK,
-            'wifi': TestCategory.WIFI,
-            'wireless': TestCategory.WIFI,
-            'voice': TestCategory.VOICE,
-            'voip': TestCategory.VOICE,
-            'usb': TestCategory.USB,
-            'security': TestCategory.SECURITY,
-            'management': TestCategory.MANAGEMENT,
-            'boot': TestCategory.BOOT,
-            'performance': TestCategory.PERFORMANCE,
-            'stress': TestCategory.STRESS,
-            'boundary': TestCategory.BOUNDARY
-        }
-        return category_map.get(category.lower(), TestCategory.PERFORMANCE)
+        return to_test_category(category)
 
 
 # ============================================================================
@@ -1055,6 +1253,7 @@ class TestExecutorWorker:
 
         self._active_session: Optional[str] = None
         self._log_callback: Optional[Callable] = None
+        self._log_cb_is_coro = False
 
     async def upload_binary(self, binary_data: bytes, filename: str) -> Dict[str, Any]:
         """Upload and validate firmware binary."""
@@ -1062,8 +1261,7 @@ class TestExecutorWorker:
 
         try:
             binary_path = self.firmware_path / filename
-            with open(binary_path, 'wb') as f:
-                f.write(binary_data)
+            binary_path.write_bytes(binary_data)
 
             checksum = hashlib.sha256(binary_data).hexdigest()
             file_size = len(binary_data)
@@ -1077,7 +1275,45 @@ class TestExecutorWorker:
                 "size_bytes": file_size,
                 "size_mb": round(file_size / 1024 / 1024, 2),
                 "sha256": checksum,
-                "uploaded_at": datetime.now().isoformat()
+                "uploaded_at": now_iso()
+            }
+
+        except Exception as e:
+            self.status = WorkerStatus.FAILED
+            raise
+
+    async def upload_binary_file(
+        self,
+        source_path: str,
+        filename: str,
+        sha256: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Move an already spooled firmware file into the workspace and validate it.
+
+        Pass ``sha256`` when it was computed while spooling to skip re-reading the file.
+        """
+        self.status = WorkerStatus.RUNNING
+
+        try:
+            binary_path = self.firmware_path / filename
+            # A plain rename when source_path is on the workspace filesystem, a full copy otherwise
+            await asyncio.to_thread(shutil.move, source_path, binary_path)
+
+            if sha256 is None:
+                sha256 = await asyncio.to_thread(_file_sha256, binary_path)
+            checksum = sha256
+            file_size = binary_path.stat().st_size
+
+            self.status = WorkerStatus.COMPLETED
+
+            return {
+                "status": "uploaded",
+                "filename": filename,
+                "path": str(binary_path),
+                "size_bytes": file_size,
+                "size_mb": round(file_size / 1024 / 1024, 2),
+                "sha256": checksum,
+                "uploaded_at": now_iso()
             }
 
         except Exception as e:
@@ -1087,15 +1323,21 @@ class TestExecutorWorker:
     async def execute_tests(
         self,
         emulator_config: Dict[str, Any],
-        tests: List[Dict[str, Any]],
+        tests: Sequence[Union[GeneratedTestCase, Dict[str, Any]]],
         firmware_path: str,
         log_callback: Optional[Callable] = None,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        firmware_sha256: Optional[str] = None
     ) -> List[TestResult]:
-        """Execute test cases in the emulator."""
+        """Execute test cases (dataclasses or registry dicts) in the emulator.
+
+        The firmware is hashed once per run (or not at all if ``firmware_sha256``
+        is given) instead of being re-read by every test.
+        """
         self.status = WorkerStatus.RUNNING
         self._log_callback = log_callback
-        session_id = f"EXEC_{uuid.uuid4().hex[:8].upper()}"
+        self._log_cb_is_coro = asyncio.iscoroutinefunction(log_callback)
+        session_id = f"EXEC_{token_hex(4).upper()}"
         self._active_session = session_id
 
         results = []
@@ -1108,9 +1350,14 @@ class TestExecutorWorker:
             await self._log(f"Total tests: {total_tests}")
             await self._log("-" * 50)
 
+            if firmware_sha256 is None and Path(firmware_path).exists():
+                firmware_sha256 = await asyncio.to_thread(_file_sha256, firmware_path)
+            firmware_checksum = firmware_sha256[:16] if firmware_sha256 else "N/A"
+
             for i, test in enumerate(tests):
-                test_id = test.get('id', f'TEST_{i}')
-                test_name = test.get('name', 'Unknown Test')
+                get = _field_getter(test)
+                test_id = get('id', f'TEST_{i}')
+                test_name = get('name', 'Unknown Test')
 
                 if progress_callback:
                     await progress_callback({
@@ -1122,7 +1369,7 @@ class TestExecutorWorker:
 
                 await self._log(f"[{i+1}/{total_tests}] Running: {test_name}")
 
-                result = await self._execute_single_test(test, emulator_config, firmware_path)
+                result = await self._execute_single_test(test, emulator_config, firmware_checksum)
                 results.append(result)
 
                 status_icon = "OK" if result.status == "passed" else "FAIL"
@@ -1142,20 +1389,21 @@ class TestExecutorWorker:
 
     async def _execute_single_test(
         self,
-        test: Dict[str, Any],
+        test: Union[GeneratedTestCase, Dict[str, Any]],
         emulator_config: Dict[str, Any],
-        firmware_path: str
+        firmware_checksum: str
     ) -> TestResult:
         """Execute a single test case."""
         start_time = datetime.now()
-        test_id = test.get('id', 'unknown')
-        test_name = test.get('name', 'Unknown')
+        get = _field_getter(test)
+        test_id = get('id', 'unknown')
+        test_name = get('name', 'Unknown')
         logs = []
 
         try:
             logs.append(f"Initializing test: {test_name}")
 
-            for step in test.get('steps', []):
+            for step in get('steps', []):
                 action = step.get('action', 'Unknown action')
                 expected = step.get('expected', '')
                 logs.append(f"  Step: {action}")
@@ -1165,14 +1413,13 @@ class TestExecutorWorker:
 
             passed = random.random() < 0.9
             status = "passed" if passed else "failed"
+            finished_at = now_iso()
 
             evidence = {
                 "execution_log": logs,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": finished_at,
                 "emulator_id": emulator_config.get('emulator_id', 'unknown'),
-                "firmware_checksum": hashlib.sha256(
-                    Path(firmware_path).read_bytes() if Path(firmware_path).exists() else b''
-                ).hexdigest()[:16] if Path(firmware_path).exists() else "N/A",
+                "firmware_checksum": firmware_checksum,
                 "checksum": hashlib.sha256(
                     json.dumps(logs).encode()
                 ).hexdigest()[:16]
@@ -1183,14 +1430,14 @@ class TestExecutorWorker:
             return TestResult(
                 test_id=test_id,
                 test_name=test_name,
-                category=test.get('category', 'unknown'),
+                category=to_test_category(get('category', 'unknown')),
                 status=status,
                 duration_sec=duration,
                 actual_result="Test completed" if passed else "Test failed",
-                expected_result=test.get('expected_results', ['Pass'])[0] if test.get('expected_results') else 'Pass',
+                expected_result=get('expected_results', ['Pass'])[0] if get('expected_results') else 'Pass',
                 evidence=evidence,
                 logs=logs,
-                timestamp=datetime.now().isoformat()
+                timestamp=finished_at
             )
 
         except Exception as e:
@@ -1198,27 +1445,28 @@ class TestExecutorWorker:
             return TestResult(
                 test_id=test_id,
                 test_name=test_name,
-                category=test.get('category', 'unknown'),
+                category=to_test_category(get('category', 'unknown')),
                 status="error",
                 duration_sec=duration,
                 actual_result=str(e),
                 expected_result="Pass",
                 evidence={"error": str(e)},
                 logs=logs + [f"ERROR: {str(e)}"],
-                timestamp=datetime.now().isoformat()
+                timestamp=now_iso()
             )
 
     async def _log(self, message: str):
         """Log message and optionally call callback."""
         logger.info(message)
         if self._log_callback:
+            payload = {"message": message, "timestamp": now_iso()}
             try:
-                if asyncio.iscoroutinefunction(self._log_callback):
-                    await self._log_callback({"message": message, "timestamp": datetime.now().isoformat()})
+                if self._log_cb_is_coro:
+                    await self._log_callback(payload)
                 else:
-                    self._log_callback({"message": message, "timestamp": datetime.now().isoformat()})
+                    self._log_callback(payload)
             except Exception as e:
-                logger.warning(f"Log callback error: {e}")
+                logger.warning("Log callback error: %s", e)
 
 
 # ============================================================================
@@ -1239,81 +1487,113 @@ class ReportGeneratorWorker:
         self,
         emulator_config: Dict[str, Any],
         test_results: List[TestResult],
-        firmware_info: Dict[str, Any]
+        firmware_info: Dict[str, Any],
+        executor: Optional[Executor] = None
     ) -> EmulationReport:
-        """Generate comprehensive emulation test report."""
+        """Generate comprehensive emulation test report.
+
+        With ``executor`` (e.g. the orchestrator's ``cpu_pool``) the report is
+        built and written there, keeping synthesis and the JSON write off the
+        event loop.
+        """
         self.status = WorkerStatus.RUNNING
 
         try:
-            report_id = f"RPT_{uuid.uuid4().hex[:8].upper()}"
-
-            total = len(test_results)
-            passed = sum(1 for r in test_results if r.status == "passed")
-            failed = sum(1 for r in test_results if r.status == "failed")
-            errors = sum(1 for r in test_results if r.status == "error")
-            skipped = sum(1 for r in test_results if r.status == "skipped")
-
-            pass_rate = round((passed / total * 100) if total > 0 else 0, 1)
-
-            summary = {
-                "total": total,
-                "passed": passed,
-                "failed": failed,
-                "errors": errors,
-                "skipped": skipped,
-                "pass_rate": pass_rate
-            }
-
-            if pass_rate >= 95:
-                verdict = "PASS"
-            elif pass_rate >= 80:
-                verdict = "CONDITIONAL"
+            args = (str(self.reports_path), emulator_config, test_results, firmware_info)
+            if executor is None:
+                report = self._build_and_save(*args)
             else:
-                verdict = "FAIL"
-
-            boot_results = [r for r in test_results if 'boot' in r.category.lower()]
-            boot_analysis = self._analyze_boot_results(boot_results)
-
-            feature_coverage = self._calculate_feature_coverage(test_results, emulator_config)
-
-            recommendations = self._generate_recommendations(test_results, verdict)
-
-            total_duration = sum(r.duration_sec for r in test_results)
-
-            evidence_checksums = {}
-            for r in test_results:
-                if r.evidence and 'checksum' in r.evidence:
-                    evidence_checksums[r.test_id] = r.evidence['checksum']
-
-            report = EmulationReport(
-                report_id=report_id,
-                emulator_id=emulator_config.get('emulator_id', 'unknown'),
-                board_name=emulator_config.get('board_name', 'unknown'),
-                firmware_info=firmware_info,
-                timestamp=datetime.now().isoformat(),
-                duration_sec=total_duration,
-                summary=summary,
-                verdict=verdict,
-                test_results=test_results,
-                boot_analysis=boot_analysis,
-                feature_coverage=feature_coverage,
-                recommendations=recommendations,
-                evidence_checksums=evidence_checksums
-            )
-
-            await self._save_report(report)
+                report = await asyncio.get_running_loop().run_in_executor(executor, self._build_and_save, *args)
 
             self.status = WorkerStatus.COMPLETED
-            logger.info(f"Generated report: {report_id} - {verdict}")
+            logger.info("Generated report: %s - %s", report.report_id, report.verdict)
 
             return report
 
         except Exception as e:
             self.status = WorkerStatus.FAILED
-            logger.error(f"Report generation failed: {e}")
+            logger.error("Report generation failed: %s", e)
             raise
 
-    def _analyze_boot_results(self, boot_results: List[TestResult]) -> Dict[str, Any]:
+    @staticmethod
+    def _build_and_save(
+        reports_path: str,
+        emulator_config: Dict[str, Any],
+        test_results: List[TestResult],
+        firmware_info: Dict[str, Any]
+    ) -> EmulationReport:
+        """Build and write a report (runs on the given executor)."""
+        report = ReportGeneratorWorker._build_report(emulator_config, test_results, firmware_info)
+        ReportGeneratorWorker._save_report(Path(reports_path), report)
+        return report
+
+    @staticmethod
+    def _build_report(
+        emulator_config: Dict[str, Any],
+        test_results: List[TestResult],
+        firmware_info: Dict[str, Any]
+    ) -> EmulationReport:
+        """Synthesize the report from test results (pure CPU)."""
+        report_id = f"RPT_{token_hex(4).upper()}"
+
+        total = len(test_results)
+        passed = sum(1 for r in test_results if r.status == "passed")
+        failed = sum(1 for r in test_results if r.status == "failed")
+        errors = sum(1 for r in test_results if r.status == "error")
+        skipped = sum(1 for r in test_results if r.status == "skipped")
+
+        pass_rate = round((passed / total * 100) if total > 0 else 0, 1)
+
+        summary = {
+            "total": total,
+            "passed": passed,
+            "failed": failed,
+            "errors": errors,
+            "skipped": skipped,
+            "pass_rate": pass_rate
+        }
+
+        if pass_rate >= 95:
+            verdict = "PASS"
+        elif pass_rate >= 80:
+            verdict = "CONDITIONAL"
+        else:
+            verdict = "FAIL"
+
+        boot_results = [r for r in test_results if r.category is TestCategory.BOOT]
+        boot_analysis = ReportGeneratorWorker._analyze_boot_results(boot_results)
+
+        feature_coverage = ReportGeneratorWorker._calculate_feature_coverage(test_results, emulator_config)
+
+        recommendations = ReportGeneratorWorker._generate_recommendations(test_results, verdict)
+
+        total_duration = sum(r.duration_sec for r in test_results)
+
+        evidence_checksums = {}
+        for r in test_results:
+            if r.evidence and 'checksum' in r.evidence:
+                evidence_checksums[r.test_id] = r.evidence['checksum']
+
+        report = EmulationReport(
+            report_id=report_id,
+            emulator_id=emulator_config.get('emulator_id', 'unknown'),
+            board_name=emulator_config.get('board_name', 'unknown'),
+            firmware_info=firmware_info,
+            timestamp=now_iso(),
+            duration_sec=total_duration,
+            summary=summary,
+            verdict=verdict,
+            test_results=test_results,
+            boot_analysis=boot_analysis,
+            feature_coverage=feature_coverage,
+            recommendations=recommendations,
+            evidence_checksums=evidence_checksums
+        )
+
+        return report
+
+    @staticmethod
+    def _analyze_boot_results(boot_results: List[TestResult]) -> Dict[str, Any]:
         """Analyze boot test results."""
         if not boot_results:
             return {"status": "no_boot_tests", "details": {}}
@@ -1335,8 +1615,8 @@ class ReportGeneratorWorker:
             }
         }
 
+    @staticmethod
     def _calculate_feature_coverage(
-        self,
         test_results: List[TestResult],
         emulator_config: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -1344,7 +1624,7 @@ class ReportGeneratorWorker:
         categories = {}
 
         for result in test_results:
-            cat = result.category
+            cat = result.category.value
             if cat not in categories:
                 categories[cat] = {"total": 0, "passed": 0, "failed": 0}
             categories[cat]["total"] += 1
@@ -1364,8 +1644,8 @@ class ReportGeneratorWorker:
             "fully_covered": sum(1 for c in categories.values() if c["coverage"] == 100)
         }
 
+    @staticmethod
     def _generate_recommendations(
-        self,
         test_results: List[TestResult],
         verdict: str
     ) -> List[str]:
@@ -1380,16 +1660,16 @@ class ReportGeneratorWorker:
 
         failure_categories = set(r.category for r in failures)
 
-        if "boot" in failure_categories:
+        if TestCategory.BOOT in failure_categories:
             recommendations.append("CRITICAL: Boot sequence issues detected. Review bootloader configuration.")
 
-        if "security" in failure_categories:
+        if TestCategory.SECURITY in failure_categories:
             recommendations.append("CRITICAL: Security test failures require immediate attention.")
 
-        if "network" in failure_categories:
+        if TestCategory.NETWORK in failure_categories:
             recommendations.append("Network connectivity issues detected. Verify network driver configuration.")
 
-        if "wifi" in failure_categories:
+        if TestCategory.WIFI in failure_categories:
             recommendations.append("WiFi test failures. Check wireless chipset drivers and firmware.")
 
         if verdict == "CONDITIONAL":
@@ -1401,19 +1681,27 @@ class ReportGeneratorWorker:
 
         return recommendations
 
-    async def _save_report(self, report: EmulationReport):
+    @staticmethod
+    def _save_report(reports_path: Path, report: EmulationReport):
         """Save report to file."""
-        report_file = self.reports_path / f"{report.report_id}.json"
-
-        report_dict = asdict(report)
-
-        report_dict['test_results'] = [
-            asdict(r) if hasattr(r, '__dataclass_fields__') else r
-            for r in report.test_results
-        ]
+        report_file = reports_path / f"{report.report_id}.json"
+
+        # Shallow-copy the top-level fields; test_results is converted
+        # separately below so it is only walked once.
+        report_dict = {
+            f.name: getattr(report, f.name)
+            for f in fields(report)
+            if f.name != 'test_results'
+        }
+        # Results are homogeneous, so decide the conversion once.
+        results = report.test_results
+        if results and is_dataclass(results[0]):
+            report_dict['test_results'] = [asdict(r) for r in results]
+        else:
+            report_dict['test_results'] = list(results)
 
         with open(report_file, 'w') as f:
-            json.dump(report_dict, f, indent=2, default=str)
+            json.dump(report_dict, f, indent=2, default=_json_default)
 
 
 # ============================================================================
@@ -1428,12 +1716,18 @@ class EmulationPlatformOrchestrator:
     1. Parse uploaded specification/requirement documents
     2. Generate emulator configuration
     3. Register emulator in registry
-    4. Generate test cases (boot + features)
+    4. Generate test cases (boot + features, concurrently)
     5. Register test cases
     6. Accept firmware binary upload
     7. Execute tests in emulator
     8. Generate comprehensive report
     9. Store report in registry
+
+    Workers that wait on IO/LLM calls stay coroutines on the event loop.
+    CPU-bound serialization (config/test dict conversion) is handed to a
+    thread pool via _run_cpu so the loop keeps serving other requests.
+    Registry writes (steps 3, 5, 9) are write-behind: they are queued and
+    drained by a background task; call flush_registry() before shutdown.
     """
 
     def __init__(self, workspace_path: str = None):
@@ -1449,30 +1743,47 @@ class EmulationPlatformOrchestrator:
         self.report_generator = ReportGeneratorWorker(str(self.workspace / "reports"))
 
         self._workflow_status: Dict[str, str] = {}
+        self._log_cb: Optional[Callable] = None
+        self._log_cb_is_coro = False
+        self._cpu_pool = ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1),
+            thread_name_prefix="phoenix2-cpu"
+        )
+        # Write-behind registry queue; started lazily on the running loop
+        self._reg_queue: Optional[asyncio.Queue] = None
+        self._reg_worker: Optional[asyncio.Task] = None
+
+    async def _ensure_parsed(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse a raw spec document; already parsed documents pass through."""
+        if 'raw_parsed' in doc:
+            return doc
+        return await self.document_parser.parse_document(doc.get('path', 'uploaded_doc'), doc.get('content'))
 
     async def run_complete_workflow(
         self,
         board_name: str,
         spec_documents: List[Dict[str, Any]],
-        firmware_binary: bytes,
+        firmware_path: str,
         firmware_filename: str,
         custom_emulator_id: Optional[str] = None,
+        firmware_sha256: Optional[str] = None,
         log_callback: Optional[Callable] = None,
         progress_callback: Optional[Callable] = None
     ) -> Dict[str, Any]:
-        """Run complete emulation workflow from spec upload to report generation."""
-        workflow_id = f"WF_{uuid.uuid4().hex[:8].upper()}"
+        """Run complete emulation workflow from spec upload to report generation.
+
+        ``spec_documents`` holds ``{"path", "content"}`` documents or results of
+        ``parse_document`` (e.g. parsed while an upload was read); the latter
+        are used as-is. ``firmware_path`` is a file already spooled to disk; it
+        is moved into the test executor's workspace. ``firmware_sha256`` may
+        carry its checksum if it was computed while spooling.
+        """
+        workflow_id = f"WF_{token_hex(4).upper()}"
         self._workflow_status = {"id": workflow_id, "status": "started"}
 
         try:
             await self._update_status("parsing_documents", log_callback)
-            parsed_docs = []
-            for doc in spec_documents:
-                parsed = await self.document_parser.parse_document(
-                    doc.get('path', 'uploaded_doc'),
-                    doc.get('content')
-                )
-                parsed_docs.append(parsed)
+            parsed_docs = await asyncio.gather(*(self._ensure_parsed(doc) for doc in spec_documents))
 
             await self._update_status("generating_emulator", log_callback)
             emulator_config = await self.emulator_generator.generate_emulator(
@@ -1482,49 +1793,47 @@ class EmulationPlatformOrchestrator:
             )
 
             await self._update_status("registering_emulator", log_callback)
-            await self.registry_manager.register_emulator(emulator_config)
+            self._register_later(self.registry_manager.register_emulator, emulator_config)
 
-            await self._update_status("generating_boot_tests", log_callback)
-            boot_tests = await self.boot_test_generator.generate_boot_tests(emulator_config)
-
-            await self._update_status("generating_feature_tests", log_callback)
-            feature_tests = await self.feature_test_generator.generate_feature_tests(emulator_config)
+            await self._update_status("generating_tests", log_callback)
+            boot_tests, feature_tests = await asyncio.gather(
+                self.boot_test_generator.generate_boot_tests(emulator_config),
+                self.feature_test_generator.generate_feature_tests(emulator_config)
+            )
 
-            all_tests = boot_tests + feature_tests
+            all_tests = [*boot_tests, *feature_tests]
+            n_tests = len(boot_tests) + len(feature_tests)
 
             await self._update_status("registering_tests", log_callback)
-            await self.registry_manager.register_tests(emulator_config.emulator_id, all_tests)
+            self._register_later(self.registry_manager.register_tests, emulator_config.emulator_id, all_tests)
 
             await self._update_status("uploading_firmware", log_callback)
-            firmware_info = await self.test_executor.upload_binary(firmware_binary, firmware_filename)
+            firmware_info = await self.test_executor.upload_binary_file(
+                firmware_path, firmware_filename, sha256=firmware_sha256
+            )
 
             await self._update_status("executing_tests", log_callback)
-            emulator_dict = self.emulator_generator._config_to_dict(emulator_config)
-            test_dicts = [asdict(t) for t in all_tests]
-
-            for t in test_dicts:
-                if hasattr(t.get('category'), 'value'):
-                    t['category'] = t['category'].value
-                if hasattr(t.get('severity'), 'value'):
-                    t['severity'] = t['severity'].value
+            emulator_dict = await self._run_cpu(self.emulator_generator._config_to_dict, emulator_config)
 
             test_results = await self.test_executor.execute_tests(
                 emulator_config=emulator_dict,
-                tests=test_dicts,
+                tests=all_tests,
                 firmware_path=firmware_info['path'],
                 log_callback=log_callback,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                firmware_sha256=firmware_info['sha256']
             )
 
             await self._update_status("generating_report", log_callback)
             report = await self.report_generator.generate_report(
                 emulator_config=emulator_dict,
                 test_results=test_results,
-                firmware_info=firmware_info
+                firmware_info=firmware_info,
+                executor=self.cpu_pool
             )
 
             await self._update_status("registering_report", log_callback)
-            await self.registry_manager.register_report(report)
+            self._register_later(self.registry_manager.register_report, report)
 
             self._workflow_status = {"id": workflow_id, "status": "completed"}
             await self._update_status("completed", log_callback)
@@ -1534,7 +1843,7 @@ class EmulationPlatformOrchestrator:
                 "status": "completed",
                 "emulator_id": emulator_config.emulator_id,
                 "board_name": board_name,
-                "tests_generated": len(all_tests),
+                "tests_generated": n_tests,
                 "tests_executed": len(test_results),
                 "report_id": report.report_id,
                 "verdict": report.verdict,
@@ -1544,22 +1853,68 @@ class EmulationPlatformOrchestrator:
 
         except Exception as e:
             self._workflow_status = {"id": workflow_id, "status": "failed", "error": str(e)}
-            logger.error(f"Workflow failed: {e}")
+            logger.error("Workflow failed: %s", e)
             raise
 
+    def _register_later(self, register: Callable, *args):
+        """Queue a registry write for the background drain task."""
+        if self._reg_worker is None or self._reg_worker.done():
+            self._reg_queue = asyncio.Queue()
+            self._reg_worker = asyncio.create_task(self._drain_registry(self._reg_queue))
+        self._reg_queue.put_nowait((register, args))
+
+    async def _drain_registry(self, reg_queue: asyncio.Queue):
+        """Perform queued registry writes one at a time."""
+        while True:
+            register, args = await reg_queue.get()
+            try:
+                await register(*args)
+            except Exception as e:
+                logger.error("Deferred registry write failed: %s", e)
+            finally:
+                reg_queue.task_done()
+
+    async def flush_registry(self):
+        """Wait for queued registry writes to land, then stop the drain task."""
+        if self._reg_worker is None:
+            return
+        if not self._reg_worker.done():
+            await self._reg_queue.join()
+            self._reg_worker.cancel()
+        self._reg_worker = None
+        self._reg_queue = None
+
+    @property
+    def cpu_pool(self) -> ThreadPoolExecutor:
+        """Thread pool for CPU-bound work, also used by the server routes."""
+        return self._cpu_pool
+
+    async def _run_cpu(self, fn: Callable, *args) -> Any:
+        """Run CPU-bound work on the orchestrator's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cpu_pool, fn, *args)
+
     async def _update_status(self, phase: str, log_callback: Optional[Callable] = None):
         """Update workflow status."""
         self._workflow_status["phase"] = phase
-        logger.info(f"Workflow phase: {phase}")
+        logger.info("Workflow phase: %s", phase)
 
-        if log_callback:
-            try:
-                if asyncio.iscoroutinefunction(log_callback):
-                    await log_callback({"phase": phase, "timestamp": datetime.now().isoformat()})
-                else:
-                    log_callback({"phase": phase, "timestamp": datetime.now().isoformat()})
-            except Exception:
-                pass
+        if log_callback is None:
+            return
+
+        # Only re-inspect the callback when a different one is passed in
+        if log_callback is not self._log_cb:
+            self._log_cb = log_callback
+            self._log_cb_is_coro = asyncio.iscoroutinefunction(log_callback)
+
+        payload = {"phase": phase, "timestamp": now_iso()}
+        try:
+            if self._log_cb_is_coro:
+                await log_callback(payload)
+            else:
+                log_callback(payload)
+        except Exception:
+            pass
 
     def get_status(self) -> Dict[str, str]:
         """Get current workflow status."""
@@ -1593,6 +1948,8 @@ __all__ = [
     'EmulatorConfig',
     'TestResult',
     'EmulationReport',
+    'to_test_category',
+    'now_iso',
     'DocumentParserWorker',
     'EmulatorGeneratorWorker',
     'RegistryManagerWorker',
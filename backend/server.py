@@ -16,17 +16,27 @@ Technology Stack:
 """
 
 import asyncio
+import codecs
+import hashlib
+import json
 import logging
 import os
+import queue
 import sys
-import uuid
-from datetime import datetime
+import tempfile
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import fields
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from secrets import token_hex
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 try:
     from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File, Query
     from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import Response, StreamingResponse
     import uvicorn
 except ImportError:
     print("ERROR: FastAPI not installed. Run: pip install fastapi uvicorn python-multipart pyyaml")
@@ -38,6 +48,35 @@ except ImportError:
     print("WARNING: PyYAML not installed. Run: pip install pyyaml")
     yaml = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Newer FastAPI releases deprecate ORJSONResponse (it carries __deprecated__) in favour
+# of their own Pydantic serialization; use it only on versions that still support it
+from fastapi.responses import JSONResponse as DefaultResponse
+if orjson is not None:
+    from fastapi.responses import ORJSONResponse
+    if not getattr(ORJSONResponse, "__deprecated__", None):
+        DefaultResponse = ORJSONResponse
+
+try:
+    from pydantic import TypeAdapter
+except ImportError:
+    # pydantic v1 has no TypeAdapter; fall back to manual reconstruction
+    TypeAdapter = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import httptools
+except ImportError:
+    httptools = None
+
 from emulation_platform import (
     EmulationPlatformOrchestrator,
     DocumentParserWorker,
@@ -46,12 +85,22 @@ from emulation_platform import (
     BootTestGeneratorWorker,
     FeatureTestGeneratorWorker,
     TestExecutorWorker,
-    ReportGeneratorWorker
+    ReportGeneratorWorker,
+    EmulatorConfig,
+    EmulatorStatus,
+    ParsedCapability,
+    ParsedRequirement,
+    TestCategory,
+    TestResult,
+    TestSeverity,
+    now_iso,
+    to_test_category
 )
 
 from chipset_emulation import (
     ChipsetEmulationOrchestrator,
-    chipset_orchestrator
+    chipset_orchestrator,
+    profile_to_dict
 )
 
 from docker_emulator import (
@@ -59,15 +108,29 @@ from docker_emulator import (
     docker_orchestrator
 )
 
+from session_store import MemorySessionStore, create_session_store
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("phoenix2.server")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Enable eager tasks on startup; flush write-behind registry writes on shutdown."""
+    # Run tasks eagerly so coroutines that never suspend skip a loop round-trip
+    # (asyncio.eager_task_factory is only available on Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    yield
+    await platform_orchestrator.flush_registry()
+
 app = FastAPI(
     title="Phoenix2 - Board Emulation Platform",
     description="Complete end-to-end board emulation platform with AI-powered workers.",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=DefaultResponse,
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -83,6 +146,174 @@ platform_orchestrator = EmulationPlatformOrchestrator()
 platform_router = APIRouter(prefix="/api/v1/platform", tags=["Emulation Platform"])
 chipset_router = APIRouter(prefix="/api/v1/chipset", tags=["Chipset Emulation"])
 
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+class BufferPool:
+    """Pool of reusable bytearrays for chunked upload reads."""
+
+    def __init__(self, count: int, size: int):
+        self.count = count
+        self.size = size
+        self._buffers: queue.SimpleQueue = queue.SimpleQueue()
+        for _ in range(count):
+            self._buffers.put(bytearray(size))
+
+    def acquire(self) -> bytearray:
+        # Never block the event loop: allocate when the pool is drained
+        try:
+            return self._buffers.get_nowait()
+        except queue.Empty:
+            return bytearray(self.size)
+
+    def release(self, buf: bytearray):
+        if self._buffers.qsize() < self.count:
+            self._buffers.put(buf)
+
+    @contextmanager
+    def borrow(self):
+        buf = self.acquire()
+        try:
+            yield buf
+        finally:
+            self.release(buf)
+
+upload_buffers = BufferPool(count=4, size=UPLOAD_CHUNK_SIZE)
+
+def _copy_upload(src, dest: str, hasher=None) -> int:
+    """Blocking chunked copy of an upload's spooled file to dest, hashing as it goes."""
+    # SpooledTemporaryFile only exposes readinto directly from Python 3.11
+    readinto = getattr(src, "readinto", None) or src._file.readinto
+    written = 0
+    with upload_buffers.borrow() as buf, open(dest, 'wb') as f:
+        view = memoryview(buf)
+        while True:
+            n = readinto(buf)
+            if not n:
+                break
+            f.write(view[:n])
+            if hasher is not None:
+                hasher.update(view[:n])
+            written += n
+    return written
+
+async def _spool_upload(upload: UploadFile, dest: str, hasher=None) -> int:
+    """Copy an upload to dest off the event loop; returns bytes written."""
+    return await asyncio.to_thread(_copy_upload, upload.file, dest, hasher)
+
+async def _spool_to_tempfile(upload: UploadFile, hasher=None, dir: Optional[Path] = None) -> str:
+    """Spool an upload into a new temp file (in dir, default TMPDIR); the caller owns (and removes) it."""
+    with tempfile.NamedTemporaryFile(prefix="phoenix2_fw_", dir=dir, delete=False) as tmp:
+        path = tmp.name
+    try:
+        await _spool_upload(upload, path, hasher)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path
+
+async def _stream_decode(upload: UploadFile, encoding: str = 'utf-8') -> str:
+    """Decode an upload chunk by chunk; raises UnicodeDecodeError on bad input."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    parts = []
+    while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+        parts.append(decoder.decode(chunk))
+    parts.append(decoder.decode(b'', final=True))
+    return ''.join(parts)
+
+# Control bytes that never occur in text documents; a spec whose head
+# contains any of them is treated as binary without trying to decode it
+_TEXT_BYTES = {7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x7F)) | set(range(0x80, 0x100))
+_NONTEXT_BYTES = bytes(b for b in range(256) if b not in _TEXT_BYTES)
+BINARY_PROBE_SIZE = 512
+
+async def _read_spec_text(upload: UploadFile) -> Optional[str]:
+    """Decode an uploaded spec as text, or return None for binary files."""
+    head = await upload.read(BINARY_PROBE_SIZE)
+    if len(head.translate(None, _NONTEXT_BYTES)) != len(head):
+        logger.warning("Skipping binary file: %s", upload.filename)
+        return None
+    await upload.seek(0)
+    try:
+        return await _stream_decode(upload, 'utf-8')
+    except UnicodeDecodeError:
+        # Try latin-1 as fallback for some text files
+        try:
+            await upload.seek(0)
+            return await _stream_decode(upload, 'latin-1')
+        except Exception:
+            logger.warning("Skipping binary file: %s", upload.filename)
+            return None
+
+# Bound per-file work when a request uploads many spec files at once
+SPEC_PARSE_SEM = asyncio.Semaphore(int(os.environ.get("PHOENIX_PARSE_CONCURRENCY", 8)))
+
+async def _read_and_parse(upload: UploadFile) -> Dict[str, Any]:
+    """Read, decode and parse one uploaded spec document."""
+    async with SPEC_PARSE_SEM:
+        content = await _read_spec_text(upload)
+        if content is None:
+            raise ValueError("not a text document")
+        return await platform_orchestrator.document_parser.parse_document(upload.filename, content)
+
+def _drop_failed(uploads: List[UploadFile], results: List[Any]) -> List[Any]:
+    """Keep successful per-file gather results, logging failures and re-raising cancellation."""
+    kept = []
+    for upload, result in zip(uploads, results):
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+        if isinstance(result, BaseException):
+            logger.warning("Skipping spec file %s: %s", upload.filename, result)
+        elif result is not None:
+            kept.append(result)
+    return kept
+
+# Registry entries only keep counts for capabilities/requirements
+_EMULATOR_DEFAULTS = {
+    "soc_id": "unknown", "vendor": "unknown", "architecture": "aarch64",
+    "cpu_type": "ARM", "cpu_cores": 4, "memory_mb": 1024, "flash_mb": 256,
+    "capabilities": [], "requirements": [], "source_documents": [], "status": "ready",
+}
+
+_CONFIG_ADAPTER = TypeAdapter(EmulatorConfig) if TypeAdapter else None
+
+def _manual_emulator_config(data: Dict[str, Any]) -> EmulatorConfig:
+    """Rebuild an EmulatorConfig field by field (pydantic v1 fallback)."""
+    capabilities = [ParsedCapability(**cap) if isinstance(cap, dict) else cap for cap in data['capabilities']]
+    requirements = [
+        ParsedRequirement(**{**req, 'severity': TestSeverity(req['severity'])})
+        for req in data['requirements'] if isinstance(req, dict)
+    ]
+    return EmulatorConfig(
+        emulator_id=data['emulator_id'], board_name=data['board_name'],
+        soc_id=data['soc_id'], vendor=data['vendor'], architecture=data['architecture'],
+        cpu_type=data['cpu_type'], cpu_cores=data['cpu_cores'],
+        memory_mb=data['memory_mb'], flash_mb=data['flash_mb'],
+        capabilities=capabilities, requirements=requirements,
+        created_at=data['created_at'], source_documents=data['source_documents'],
+        docker_image=data.get('docker_image'), status=EmulatorStatus(data['status'])
+    )
+
+# emulator_id -> (registry version, EmulatorConfig)
+_config_cache: Dict[str, tuple] = {}
+
+def _build_emulator_config(emulator: Dict[str, Any]) -> EmulatorConfig:
+    """Validate a registry emulator entry into an EmulatorConfig, cached per version."""
+    emulator_id, version = emulator['emulator_id'], emulator.get('version', 0)
+    cached = _config_cache.get(emulator_id)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    data = {**_EMULATOR_DEFAULTS, **emulator}
+    data['requirements'] = [
+        {'severity': 'medium', **req} if isinstance(req, dict) else req for req in data['requirements']
+    ]
+    if _CONFIG_ADAPTER is None:
+        config = _manual_emulator_config(data)
+    else:
+        config = _CONFIG_ADAPTER.validate_python(data)
+    _config_cache[emulator_id] = (version, config)
+    return config
+
 @platform_router.get("/status")
 async def get_platform_status():
     return {
@@ -90,14 +321,13 @@ async def get_platform_status():
         "version": "1.0.0",
         "workers": platform_orchestrator.get_worker_statuses(),
         "workflow_status": platform_orchestrator.get_status(),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 @platform_router.post("/parse-document")
 async def parse_document(file: UploadFile = File(...)):
     try:
-        content = await file.read()
-        content_str = content.decode('utf-8')
+        content_str = await _stream_decode(file)
         result = await platform_orchestrator.document_parser.parse_document(file.filename, content_str)
         return {
             "status": "success",
@@ -118,41 +348,29 @@ async def create_emulator(
     spec_files: List[UploadFile] = File(...)
 ):
     try:
-        parsed_docs = []
-        for file in spec_files:
-            content = await file.read()
-            parsed = await platform_orchestrator.document_parser.parse_document(file.filename, content.decode('utf-8'))
-            parsed_docs.append(parsed)
+        results = await asyncio.gather(*(_read_and_parse(file) for file in spec_files), return_exceptions=True)
+        parsed_docs = _drop_failed(spec_files, results)
+        if not parsed_docs:
+            raise HTTPException(status_code=400, detail="No valid specification documents provided")
         config = await platform_orchestrator.emulator_generator.generate_emulator(board_name, parsed_docs, emulator_id)
         await platform_orchestrator.registry_manager.register_emulator(config)
         return {"status": "created", "emulator_id": config.emulator_id, "board_name": config.board_name}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @platform_router.post("/generate-tests/{emulator_id}")
 async def generate_tests(emulator_id: str):
     try:
-        from emulation_platform import EmulatorConfig, EmulatorStatus, ParsedCapability, ParsedRequirement, TestSeverity
         emulator = platform_orchestrator.registry_manager.get_emulator(emulator_id)
         if not emulator:
             raise HTTPException(status_code=404, detail=f"Emulator {emulator_id} not found")
-        capabilities = [ParsedCapability(**cap) if isinstance(cap, dict) else cap for cap in emulator.get('capabilities', [])]
-        requirements = []
-        for req in emulator.get('requirements', []):
-            if isinstance(req, dict):
-                req['severity'] = TestSeverity(req.get('severity', 'medium'))
-                requirements.append(ParsedRequirement(**req))
-        config = EmulatorConfig(
-            emulator_id=emulator['emulator_id'], board_name=emulator['board_name'],
-            soc_id=emulator['soc_id'], vendor=emulator['vendor'], architecture=emulator['architecture'],
-            cpu_type=emulator['cpu_type'], cpu_cores=emulator['cpu_cores'],
-            memory_mb=emulator['memory_mb'], flash_mb=emulator['flash_mb'],
-            capabilities=capabilities, requirements=requirements,
-            created_at=emulator['created_at'], source_documents=emulator.get('source_documents', []),
-            docker_image=emulator.get('docker_image'), status=EmulatorStatus(emulator['status'])
+        config = _build_emulator_config(emulator)
+        boot_tests, feature_tests = await asyncio.gather(
+            platform_orchestrator.boot_test_generator.generate_boot_tests(config),
+            platform_orchestrator.feature_test_generator.generate_feature_tests(config)
         )
-        boot_tests = await platform_orchestrator.boot_test_generator.generate_boot_tests(config)
-        feature_tests = await platform_orchestrator.feature_test_generator.generate_feature_tests(config)
         all_tests = boot_tests + feature_tests
         await platform_orchestrator.registry_manager.register_tests(emulator_id, all_tests)
         return {"status": "generated", "emulator_id": emulator_id, "total_tests": len(all_tests)}
@@ -169,36 +387,34 @@ async def run_complete_workflow(
     firmware_file: UploadFile = File(...)
 ):
     try:
-        spec_documents = []
-        for file in spec_files:
-            content = await file.read()
-            # Try to decode as text, skip binary files with warning
-            try:
-                content_str = content.decode('utf-8')
-                spec_documents.append({"path": file.filename, "content": content_str})
-            except UnicodeDecodeError:
-                # Try latin-1 as fallback for some text files
-                try:
-                    content_str = content.decode('latin-1')
-                    spec_documents.append({"path": file.filename, "content": content_str})
-                except:
-                    logger.warning(f"Skipping binary file: {file.filename}")
-                    continue
+        # Each upload is parsed as soon as it is decoded; the orchestrator uses the results as-is
+        results = await asyncio.gather(*(_read_and_parse(file) for file in spec_files), return_exceptions=True)
+        spec_documents = _drop_failed(spec_files, results)
 
         if not spec_documents:
             raise HTTPException(status_code=400, detail="No valid specification documents provided. Please upload text files (.yaml, .json, .md, .txt)")
 
-        firmware_data = await firmware_file.read()
-        result = await platform_orchestrator.run_complete_workflow(
-            board_name=board_name, spec_documents=spec_documents,
-            firmware_binary=firmware_data, firmware_filename=firmware_file.filename,
-            custom_emulator_id=emulator_id
+        sha256 = hashlib.sha256()
+        # Spool next to its destination so upload_binary_file's move is a rename
+        firmware_path = await _spool_to_tempfile(
+            firmware_file, sha256, platform_orchestrator.test_executor.firmware_path
         )
+        try:
+            result = await platform_orchestrator.run_complete_workflow(
+                board_name=board_name, spec_documents=spec_documents,
+                firmware_path=firmware_path, firmware_filename=firmware_file.filename,
+                firmware_sha256=sha256.hexdigest(),
+                custom_emulator_id=emulator_id
+            )
+        finally:
+            # The orchestrator moves the file on success; clean up otherwise
+            if os.path.exists(firmware_path):
+                os.remove(firmware_path)
         return result
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Workflow error: {e}")
+        logger.error("Workflow error: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @platform_router.get("/registry/emulators")
@@ -218,27 +434,90 @@ async def list_reports(emulator_id: Optional[str] = None):
     reports = platform_orchestrator.registry_manager.list_reports(emulator_id)
     return {"reports": reports, "count": len(reports)}
 
+# Chipset metadata is static, so dashboard polls are served from a short TTL cache
+CHIPSET_CACHE_TTL = 60.0
+# key -> (expiry, task); a pending task means a build is in flight
+_chipset_cache: Dict[str, tuple] = {}
+
+def _drop_cached(key: str, task: asyncio.Task):
+    entry = _chipset_cache.get(key)
+    if entry and entry[1] is task:
+        del _chipset_cache[key]
+
+def _settle_cached(key: str, task: asyncio.Task):
+    """Drop failed, cancelled and None (unknown id) results so they are rebuilt."""
+    if task.cancelled() or task.exception() is not None or task.result() is None:
+        _drop_cached(key, task)
+
+async def _cached(key: str, factory):
+    """Return a cached value for key; concurrent misses share one factory() task.
+
+    Callers only await the task through a shield, so cancelling one of them
+    never cancels the build or the other callers waiting on it.
+    """
+    loop = asyncio.get_running_loop()
+    now = time.monotonic()
+    entry = _chipset_cache.get(key)
+    if entry and entry[0] > now:
+        task = entry[1]
+        if task.done():
+            return task.result()
+        if task.get_loop() is loop:
+            return await asyncio.shield(task)
+
+    task = loop.create_task(factory())
+    _chipset_cache[key] = (now + CHIPSET_CACHE_TTL, task)
+    task.add_done_callback(partial(_settle_cached, key))
+    return await asyncio.shield(task)
+
+async def _cached_supported():
+    return await _cached("supported", chipset_orchestrator.get_supported_chipsets)
+
+async def _cached_profile(chipset_id: str):
+    """Cached profile; chipset_id must already be normalized (upper case)."""
+    return await _cached(
+        f"profile:{chipset_id}",
+        lambda: chipset_orchestrator.chipset_profile_worker.get_profile(chipset_id)
+    )
+
+async def _build_profile_dict(chipset_id: str) -> Optional[Dict[str, Any]]:
+    profile = await _cached_profile(chipset_id)
+    if not profile:
+        return None
+    return profile_to_dict(profile)
+
+async def _encoded(build) -> Optional[bytes]:
+    """Await build and pre-encode its result so cache hits skip serialization."""
+    value = await build
+    if value is None:
+        return None
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+async def _build_hal(chipset_id: str) -> Optional[Dict[str, Any]]:
+    profile = await _cached_profile(chipset_id)
+    if not profile:
+        return None
+    return await chipset_orchestrator.hal_worker.create_hal(profile)
+
 @chipset_router.get("/supported")
 async def get_supported_chipsets():
-    return await chipset_orchestrator.get_supported_chipsets()
+    return await _cached_supported()
 
 @chipset_router.get("/vendors")
 async def get_vendors():
-    chipsets = await chipset_orchestrator.get_supported_chipsets()
+    chipsets = await _cached_supported()
     return {"vendors": chipsets["vendors"], "count": len(chipsets["vendors"])}
 
 @chipset_router.get("/profile/{chipset_id}")
 async def get_chipset_profile(chipset_id: str):
-    from dataclasses import asdict
-    profile = await chipset_orchestrator.chipset_profile_worker.get_profile(chipset_id)
-    if not profile:
+    # One spelling per chipset, so cached bodies do not depend on the first caller's case
+    chipset_id = chipset_id.upper()
+    body = await _cached(f"profile_json:{chipset_id}", lambda: _encoded(_build_profile_dict(chipset_id)))
+    if not body:
         raise HTTPException(status_code=404, detail=f"Chipset {chipset_id} not found")
-    profile_dict = asdict(profile)
-    profile_dict['vendor'] = profile.vendor.value
-    profile_dict['architecture'] = profile.architecture.value
-    profile_dict['boot_sequence'] = [{**s, 'stage': s['stage'].value} for s in profile_dict['boot_sequence']]
-    profile_dict['peripherals'] = [{**p, 'type': p['type'].value} for p in profile_dict['peripherals']]
-    return profile_dict
+    return Response(content=body, media_type="application/json")
 
 @chipset_router.post("/initialize/{chipset_id}")
 async def initialize_chipset_emulator(chipset_id: str):
@@ -247,15 +526,28 @@ async def initialize_chipset_emulator(chipset_id: str):
         raise HTTPException(status_code=400, detail=result.get("message"))
     return result
 
+DEFAULT_FIRMWARE_PATH = "/tmp/firmware.bin"
+
 @chipset_router.post("/boot-simulation/{chipset_id}")
 async def run_boot_simulation(chipset_id: str, firmware: Optional[UploadFile] = File(None)):
     await chipset_orchestrator.initialize_emulator(chipset_id)
-    firmware_path = "/tmp/firmware.bin"
-    if firmware:
-        data = await firmware.read()
-        with open(firmware_path, 'wb') as f:
-            f.write(data)
-    return await chipset_orchestrator.run_boot_simulation(firmware_path)
+    if not firmware:
+        return await chipset_orchestrator.run_boot_simulation(DEFAULT_FIRMWARE_PATH)
+
+    # Per-request file so concurrent simulations never share one path
+    digest = hashlib.blake2b(digest_size=16)
+    firmware_path = await _spool_to_tempfile(firmware, digest)
+    try:
+        size_bytes = os.path.getsize(firmware_path)
+        result = await chipset_orchestrator.run_boot_simulation(firmware_path)
+    finally:
+        os.remove(firmware_path)
+    result["firmware"] = {
+        "filename": firmware.filename,
+        "size_bytes": size_bytes,
+        "blake2b": digest.hexdigest()
+    }
+    return result
 
 @chipset_router.get("/status")
 async def get_chipset_emulator_status():
@@ -263,29 +555,50 @@ async def get_chipset_emulator_status():
 
 @chipset_router.get("/hal/{chipset_id}")
 async def get_chipset_hal(chipset_id: str):
-    profile = await chipset_orchestrator.chipset_profile_worker.get_profile(chipset_id)
-    if not profile:
+    chipset_id = chipset_id.upper()
+    body = await _cached(f"hal_json:{chipset_id}", lambda: _encoded(_build_hal(chipset_id)))
+    if not body:
         raise HTTPException(status_code=404, detail=f"Chipset {chipset_id} not found")
-    return await chipset_orchestrator.hal_worker.create_hal(profile)
+    return Response(content=body, media_type="application/json")
+
+# Constant parts of the root and health payloads; only the timestamp varies
+_ROOT_INFO = {
+    "name": "Phoenix2 - Board Emulation Platform",
+    "version": "1.0.0",
+    "endpoints": {"platform": "/api/v1/platform", "chipset": "/api/v1/chipset", "docs": "/docs"},
+    "supported_vendors": ["qualcomm", "mediatek", "broadcom", "airoha", "amlogic", "realtek"]
+}
+_HEALTH_INFO = {"status": "healthy", "service": "phoenix2"}
 
 @app.get("/")
 async def root():
-    return {
-        "name": "Phoenix2 - Board Emulation Platform",
-        "version": "1.0.0",
-        "endpoints": {"platform": "/api/v1/platform", "chipset": "/api/v1/chipset", "docs": "/docs"},
-        "supported_vendors": ["qualcomm", "mediatek", "broadcom", "airoha", "amlogic", "realtek"],
-        "timestamp": datetime.now().isoformat()
-    }
+    return {**_ROOT_INFO, "timestamp": now_iso()}
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "phoenix2", "timestamp": datetime.now().isoformat()}
+    return {**_HEALTH_INFO, "timestamp": now_iso()}
 
 verification_router = APIRouter(prefix="/api/v1/verification", tags=["Binary Verification"])
 
-# In-memory storage for verification sessions
-verification_sessions: Dict[str, Dict[str, Any]] = {}
+# Cap concurrently running emulator containers
+VERIFY_SEM = asyncio.Semaphore(int(os.environ.get("PHOENIX_VERIFY_CONCURRENCY", 4)))
+
+# Verification sessions (in-memory, or Redis when PHOENIX_REDIS_URL is set)
+session_store = create_session_store()
+
+# SSE subscriber queues for sessions whose run is in this process
+log_subscribers: Dict[str, Set[asyncio.Queue]] = {}
+LOG_STREAM_POLL_SEC = 1.0
+
+async def _append_session_log(session_id: str, entry: Dict[str, Any]):
+    """Record a log entry and push it to live stream subscribers."""
+    index = await session_store.append_log(session_id, entry) - 1
+    for subscriber in log_subscribers.get(session_id, ()):
+        subscriber.put_nowait((index, entry))
+
+def _sse(entry: Dict[str, Any], event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(entry)}\n\n"
 
 @verification_router.get("/docker-status")
 async def get_docker_status():
@@ -315,20 +628,29 @@ async def upload_binary_for_verification(
         if not emulator:
             raise HTTPException(status_code=404, detail=f"Emulator {emulator_id} not found")
 
-        binary_data = await binary_file.read()
-        firmware_info = await platform_orchestrator.test_executor.upload_binary(binary_data, binary_file.filename)
+        sha256 = hashlib.sha256()
+        binary_path = await _spool_to_tempfile(
+            binary_file, sha256, platform_orchestrator.test_executor.firmware_path
+        )
+        try:
+            firmware_info = await platform_orchestrator.test_executor.upload_binary_file(
+                binary_path, binary_file.filename, sha256=sha256.hexdigest()
+            )
+        finally:
+            # upload_binary_file moves the file on success; clean up otherwise
+            if os.path.exists(binary_path):
+                os.remove(binary_path)
 
-        session_id = f"VER_{uuid.uuid4().hex[:8].upper()}"
-        verification_sessions[session_id] = {
+        session_id = f"VER_{token_hex(4).upper()}"
+        await session_store.set(session_id, {
             "session_id": session_id,
             "emulator_id": emulator_id,
             "emulator_info": emulator,
             "firmware_info": firmware_info,
             "status": "uploaded",
-            "logs": [],
             "results": None,
-            "created_at": datetime.now().isoformat()
-        }
+            "created_at": now_iso()
+        })
 
         return {
             "status": "uploaded",
@@ -339,23 +661,59 @@ async def upload_binary_for_verification(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Binary upload error: {e}")
+        logger.error("Binary upload error: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
+def _docker_to_results(raw_results: List[Dict[str, Any]], tests: List[Dict[str, Any]]) -> List[TestResult]:
+    """Convert Docker test result dicts to TestResults in one pass."""
+    categories = {t.get("id"): to_test_category(t.get("category", "")) for t in tests}
+    default_category = to_test_category("")
+    boot = TestCategory.BOOT
+    converted_at = now_iso()
+    return [
+        TestResult(
+            test_id=tr["test_id"],
+            test_name=tr["test_name"],
+            category=boot if "boot" in tr["test_name"].lower() else categories.get(tr["test_id"], default_category),
+            status=tr["status"],
+            duration_sec=tr["duration_sec"],
+            actual_result=tr["output"][:200] if tr.get("output") else "Completed",
+            expected_result="Pass",
+            evidence=tr.get("evidence", {}),
+            logs=[tr.get("output", "")],
+            timestamp=converted_at
+        )
+        for tr in raw_results
+    ]
+
+# Field names and a matching attrgetter per dataclass, built on first use
+_GETTERS: Dict[type, Tuple[Tuple[str, ...], Callable]] = {}
+
+def _record_to_dict(obj: Any) -> Dict[str, Any]:
+    """Shallow asdict() for flat records; nested values are shared, not copied."""
+    shape = _GETTERS.get(type(obj))
+    if shape is None:
+        names = tuple(f.name for f in fields(obj))
+        getter = attrgetter(*names) if len(names) > 1 else (lambda o, n=names[0]: (getattr(o, n),))
+        shape = _GETTERS[type(obj)] = (names, getter)
+    names, getter = shape
+    return dict(zip(names, getter(obj)))
+
+def _results_to_dicts(test_results: List[Any]) -> List[Dict[str, Any]]:
+    return [_record_to_dict(r) if type(r) is TestResult else r for r in test_results]
+
 @verification_router.post("/run/{session_id}")
 async def run_verification(session_id: str, use_docker: bool = Query(True, description="Use Docker-based emulation")):
     """Run verification tests for a previously uploaded binary using Docker emulation."""
-    if session_id not in verification_sessions:
+    session = await session_store.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail=f"Verification session {session_id} not found")
 
-    session = verification_sessions[session_id]
-
-    if session["status"] == "running":
+    # Compare-and-set, so concurrent runs on different server workers cannot both start
+    if not await session_store.try_start(session_id, started_at=now_iso()):
         raise HTTPException(status_code=400, detail="Verification already running")
-
-    session["status"] = "running"
-    session["started_at"] = datetime.now().isoformat()
-    session["logs"] = []
+    await session_store.clear_logs(session_id)
+    log_subscribers.setdefault(session_id, set())
 
     try:
         emulator_id = session["emulator_id"]
@@ -363,82 +721,53 @@ async def run_verification(session_id: str, use_docker: bool = Query(True, descr
 
         # Generate tests if not available
         if not tests:
-            from emulation_platform import EmulatorConfig, EmulatorStatus, ParsedCapability, ParsedRequirement, TestSeverity
-            emulator = session["emulator_info"]
-            capabilities = [ParsedCapability(**cap) if isinstance(cap, dict) else cap for cap in emulator.get('capabilities', [])]
-            requirements = []
-            for req in emulator.get('requirements', []):
-                if isinstance(req, dict):
-                    req['severity'] = TestSeverity(req.get('severity', 'medium'))
-                    requirements.append(ParsedRequirement(**req))
-
-            config = EmulatorConfig(
-                emulator_id=emulator['emulator_id'], board_name=emulator['board_name'],
-                soc_id=emulator.get('soc_id', 'unknown'), vendor=emulator.get('vendor', 'unknown'),
-                architecture=emulator.get('architecture', 'aarch64'),
-                cpu_type=emulator.get('cpu_type', 'ARM'), cpu_cores=emulator.get('cpu_cores', 4),
-                memory_mb=emulator.get('memory_mb', 1024), flash_mb=emulator.get('flash_mb', 256),
-                capabilities=capabilities, requirements=requirements,
-                created_at=emulator['created_at'], source_documents=emulator.get('source_documents', []),
-                status=EmulatorStatus(emulator.get('status', 'ready'))
-            )
+            config = _build_emulator_config(session["emulator_info"])
 
-            boot_tests = await platform_orchestrator.boot_test_generator.generate_boot_tests(config)
-            feature_tests = await platform_orchestrator.feature_test_generator.generate_feature_tests(config)
+            boot_tests, feature_tests = await asyncio.gather(
+                platform_orchestrator.boot_test_generator.generate_boot_tests(config),
+                platform_orchestrator.feature_test_generator.generate_feature_tests(config)
+            )
             all_tests = boot_tests + feature_tests
-            await platform_orchestrator.registry_manager.register_tests(emulator_id, all_tests)
-            tests = platform_orchestrator.registry_manager.get_tests(emulator_id)
+            registered = await platform_orchestrator.registry_manager.register_tests(emulator_id, all_tests)
+            tests = registered["tests"]
 
-        def log_callback(log_entry):
-            session["logs"].append(log_entry)
+        async def log_callback(log_entry):
+            await _append_session_log(session_id, log_entry)
 
         # Use Docker-based emulation
-        docker_result = await docker_orchestrator.run_verification(
-            emulator_config=session["emulator_info"],
-            tests=tests,
-            firmware_path=session["firmware_info"]["path"],
-            log_callback=log_callback
-        )
+        async with VERIFY_SEM:
+            docker_result = await docker_orchestrator.run_verification(
+                emulator_config=session["emulator_info"],
+                tests=tests,
+                firmware_path=session["firmware_info"]["path"],
+                log_callback=log_callback
+            )
 
         # Convert Docker results to standard TestResult format for report generation
-        from emulation_platform import TestResult
-        test_results = []
-        for tr in docker_result.get("test_results", []):
-            test_results.append(TestResult(
-                test_id=tr["test_id"],
-                test_name=tr["test_name"],
-                category="boot" if "boot" in tr["test_name"].lower() else "feature",
-                status=tr["status"],
-                duration_sec=tr["duration_sec"],
-                actual_result=tr["output"][:200] if tr.get("output") else "Completed",
-                expected_result="Pass",
-                evidence=tr.get("evidence", {}),
-                logs=[tr.get("output", "")],
-                timestamp=datetime.now().isoformat()
-            ))
+        test_results = _docker_to_results(docker_result.get("test_results", []), tests)
 
         # Generate comprehensive report
         report = await platform_orchestrator.report_generator.generate_report(
             emulator_config=session["emulator_info"],
             test_results=test_results,
-            firmware_info=session["firmware_info"]
+            firmware_info=session["firmware_info"],
+            executor=platform_orchestrator.cpu_pool
         )
         await platform_orchestrator.registry_manager.register_report(report)
 
-        from dataclasses import asdict
-        session["results"] = {
+        test_result_dicts = await asyncio.to_thread(_results_to_dicts, test_results)
+        results = {
             "report_id": report.report_id,
             "verdict": report.verdict,
             "summary": report.summary,
             "docker_mode": docker_result.get("docker_mode", "simulated"),
             "container_id": docker_result.get("container_id"),
-            "test_results": [asdict(r) if hasattr(r, '__dataclass_fields__') else r for r in test_results],
+            "test_results": test_result_dicts,
             "boot_analysis": report.boot_analysis,
             "feature_coverage": report.feature_coverage,
             "recommendations": report.recommendations
         }
-        session["status"] = "completed"
-        session["completed_at"] = datetime.now().isoformat()
+        await session_store.update(session_id, results=results, status="completed", completed_at=now_iso())
 
         return {
             "status": "completed",
@@ -450,19 +779,23 @@ async def run_verification(session_id: str, use_docker: bool = Query(True, descr
         }
 
     except Exception as e:
-        session["status"] = "failed"
-        session["error"] = str(e)
-        session["logs"].append({"message": f"ERROR: {str(e)}", "timestamp": datetime.now().isoformat()})
-        logger.error(f"Verification error: {e}")
+        await session_store.update(session_id, status="failed", error=str(e))
+        await _append_session_log(session_id, {"message": f"ERROR: {str(e)}", "timestamp": now_iso()})
+        logger.error("Verification error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+    finally:
+        # Wake stream subscribers so they can close
+        for subscriber in log_subscribers.pop(session_id, ()):
+            subscriber.put_nowait(None)
+
 @verification_router.get("/status/{session_id}")
 async def get_verification_status(session_id: str):
     """Get status of a verification session."""
-    if session_id not in verification_sessions:
+    session = await session_store.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
 
-    session = verification_sessions[session_id]
     return {
         "session_id": session_id,
         "status": session["status"],
@@ -470,7 +803,7 @@ async def get_verification_status(session_id: str):
         "created_at": session["created_at"],
         "started_at": session.get("started_at"),
         "completed_at": session.get("completed_at"),
-        "log_count": len(session.get("logs", [])),
+        "log_count": await session_store.log_count(session_id),
         "has_results": session.get("results") is not None
     }
 
@@ -480,28 +813,75 @@ async def get_verification_logs(
     offset: int = Query(0, description="Log offset for pagination")
 ):
     """Get logs from a verification session."""
-    if session_id not in verification_sessions:
+    session = await session_store.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
 
-    session = verification_sessions[session_id]
-    logs = session.get("logs", [])
+    logs, total_logs = await session_store.get_logs(session_id, offset)
 
     return {
         "session_id": session_id,
         "status": session["status"],
-        "logs": logs[offset:],
-        "total_logs": len(logs),
+        "logs": logs,
+        "total_logs": total_logs,
         "offset": offset
     }
 
+async def _log_events(session_id: str, offset: int):
+    """Yield SSE events for a session's logs from offset until its run ends."""
+    subscriber = None
+    if session_id in log_subscribers:
+        subscriber = asyncio.Queue()
+        log_subscribers[session_id].add(subscriber)
+    try:
+        logs, total = await session_store.get_logs(session_id, offset)
+        for entry in logs:
+            yield _sse(entry)
+        next_index = max(offset, total)
+
+        if subscriber is not None:
+            while (item := await subscriber.get()) is not None:
+                index, entry = item
+                if index >= next_index:
+                    yield _sse(entry)
+                    next_index = index + 1
+        else:
+            # Not running here (idle, or running on another server worker)
+            while (session := await session_store.get(session_id)) and session["status"] == "running":
+                await asyncio.sleep(LOG_STREAM_POLL_SEC)
+                logs, total = await session_store.get_logs(session_id, next_index)
+                for entry in logs:
+                    yield _sse(entry)
+                next_index = max(next_index, total)
+
+        session = await session_store.get(session_id)
+        yield _sse({"status": session["status"] if session else "unknown"}, event="end")
+    finally:
+        if subscriber is not None and session_id in log_subscribers:
+            log_subscribers[session_id].discard(subscriber)
+
+@verification_router.get("/logs-stream/{session_id}")
+async def stream_verification_logs(
+    session_id: str,
+    offset: int = Query(0, description="Skip logs before this offset")
+):
+    """Stream logs of a verification session as Server-Sent Events."""
+    if await session_store.get(session_id) is None:
+        raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+
+    return StreamingResponse(
+        _log_events(session_id, offset),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @verification_router.get("/results/{session_id}")
 async def get_verification_results(session_id: str):
     """Get test results from a completed verification session."""
-    if session_id not in verification_sessions:
+    session = await session_store.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
 
-    session = verification_sessions[session_id]
-
     if session["status"] != "completed":
         return {
             "session_id": session_id,
@@ -520,9 +900,9 @@ async def get_verification_results(session_id: str):
 async def list_verification_sessions():
     """List all verification sessions."""
     sessions = []
-    for session_id, session in verification_sessions.items():
+    for session in await session_store.list():
         sessions.append({
-            "session_id": session_id,
+            "session_id": session["session_id"],
             "emulator_id": session["emulator_id"],
             "status": session["status"],
             "created_at": session["created_at"],
@@ -534,13 +914,55 @@ app.include_router(platform_router)
 app.include_router(chipset_router)
 app.include_router(verification_router)
 
+def _exec_gunicorn(host: str, port: int, workers: int):
+    """Replace this process with gunicorn running uvicorn workers."""
+    os.execvp("gunicorn", [
+        "gunicorn", "server:app",
+        "--chdir", os.path.dirname(os.path.abspath(__file__)),
+        "-k", "uvicorn.workers.UvicornWorker",
+        "-w", str(workers),
+        "--bind", f"{host}:{port}"
+    ])
+
 def main():
     host = os.environ.get("HOST", "0.0.0.0")
     port = int(os.environ.get("PORT", 8000))
+    use_gunicorn = os.environ.get("PHOENIX_USE_GUNICORN", "").lower() in ("1", "true", "yes")
+    if use_gunicorn:
+        default_workers = min(int(os.environ.get("MAX_WORKERS", 9)), 2 * (os.cpu_count() or 1) + 1)
+    else:
+        default_workers = 1
+    workers = int(os.environ.get("WORKERS", default_workers))
     print(f"\n  PHOENIX2 - Board Emulation Platform v1.0")
     print(f"  Server: http://{host}:{port}")
     print(f"  Docs: http://{host}:{port}/docs\n")
-    uvicorn.run(app, host=host, port=port)
+    if workers > 1:
+        if isinstance(session_store, MemorySessionStore):
+            # /verification requests would hit workers that do not know the session
+            if os.environ.get("PHOENIX_ALLOW_MEMORY_SESSIONS", "").lower() not in ("1", "true", "yes"):
+                print("  ERROR: WORKERS > 1 requires a shared session store. Set PHOENIX_REDIS_URL")
+                print("  (or PHOENIX_ALLOW_MEMORY_SESSIONS=1 to run anyway, e.g. for development).\n")
+                sys.exit(1)
+            print("  WARNING: WORKERS > 1 with in-memory sessions (PHOENIX_ALLOW_MEMORY_SESSIONS);")
+            print("  /verification requests may hit a worker that does not know the session.\n")
+        # The registry is shared through its directory and index lock, i.e. per host only
+        print("  NOTE: WORKERS > 1 share the emulator registry through its local directory;")
+        print("  all workers must run on this host (the registry is not shared across machines).\n")
+    if not (uvloop and httptools):
+        print("  NOTE: install uvloop and httptools for the faster event loop and HTTP parser\n")
+    if use_gunicorn:
+        try:
+            _exec_gunicorn(host, port, workers)
+        except FileNotFoundError:
+            print("  WARNING: gunicorn not installed (pip install gunicorn); using uvicorn\n")
+    # uvloop/httptools are optional (e.g. no uvloop on Windows); fall back to the pure-Python defaults
+    uvicorn.run(
+        "server:app" if workers > 1 else app,
+        host=host, port=port,
+        loop="uvloop" if uvloop else "asyncio",
+        http="httptools" if httptools else "h11",
+        workers=workers
+    )
 
 if __name__ == "__main__":
     main()
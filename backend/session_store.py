@@ -0,0 +1,261 @@
+"""
+Phoenix2 Verification Session Store v1.0
+
+Storage backends for binary verification sessions:
+1. MemorySessionStore - In-process dict (single server worker)
+2. RedisSessionStore - Redis hashes/lists shared by all server workers
+
+Session fields and logs are stored separately so log appends and paged
+log reads never rewrite the whole session. Only the newest PHOENIX_MAX_LOGS
+entries (default 10000) of a session are kept; log offsets and totals still
+count the dropped ones. Set PHOENIX_REDIS_URL to use Redis; sessions expire
+after PHOENIX_SESSION_TTL seconds (default 24h).
+"""
+
+import json
+import logging
+import os
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from emulation_platform import _json_default
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+logger = logging.getLogger("phoenix2.session_store")
+
+SESSION_TTL = int(os.environ.get("PHOENIX_SESSION_TTL", 24 * 3600))
+MAX_LOGS = int(os.environ.get("PHOENIX_MAX_LOGS", 10000))
+
+
+# ============================================================================
+# In-Memory Store
+# ============================================================================
+
+class MemorySessionStore:
+    """Session store backed by process-local dicts."""
+
+    def __init__(self, max_logs: int = MAX_LOGS):
+        self.max_logs = max_logs
+        self._sessions: Dict[str, Dict[str, Any]] = {}
+        self._logs: Dict[str, deque] = {}
+        self._logs_dropped: Dict[str, int] = {}
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get session fields, or None if unknown."""
+        return self._sessions.get(session_id)
+
+    async def set(self, session_id: str, data: Dict[str, Any]):
+        """Create or replace a session and reset its logs."""
+        self._sessions[session_id] = dict(data)
+        await self.clear_logs(session_id)
+
+    async def update(self, session_id: str, **fields):
+        """Update selected session fields."""
+        self._sessions[session_id].update(fields)
+
+    async def try_start(self, session_id: str, **fields) -> bool:
+        """Set status to "running" (plus fields) unless it already is; False if not started."""
+        session = self._sessions.get(session_id)
+        if session is None or session.get("status") == "running":
+            return False
+        session.update(fields, status="running")
+        return True
+
+    async def append_log(self, session_id: str, entry: Dict[str, Any]) -> int:
+        """Append one log entry to a session; returns the new log count."""
+        logs = self._logs[session_id]
+        if len(logs) == self.max_logs:
+            self._logs_dropped[session_id] += 1
+        logs.append(entry)
+        return len(logs) + self._logs_dropped[session_id]
+
+    async def clear_logs(self, session_id: str):
+        """Drop all logs of a session."""
+        self._logs[session_id] = deque(maxlen=self.max_logs)
+        self._logs_dropped[session_id] = 0
+
+    async def get_logs(self, session_id: str, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """Get kept logs from offset on, plus the total log count."""
+        logs = self._logs.get(session_id, ())
+        dropped = self._logs_dropped.get(session_id, 0)
+        return list(islice(logs, max(offset - dropped, 0), None)), len(logs) + dropped
+
+    async def log_count(self, session_id: str) -> int:
+        """Number of logs recorded for a session, including dropped ones."""
+        return len(self._logs.get(session_id, ())) + self._logs_dropped.get(session_id, 0)
+
+    async def list(self) -> List[Dict[str, Any]]:
+        """List all sessions."""
+        return list(self._sessions.values())
+
+
+# ============================================================================
+# Redis Store
+# ============================================================================
+
+class RedisSessionStore:
+    """
+    Session store backed by Redis.
+
+    Each session is a hash at phoenix:session:{sid} (JSON-encoded values)
+    with its newest logs in the list phoenix:session:{sid}:logs and the
+    number of logs ever appended in phoenix:session:{sid}:log_count.
+    """
+
+    PREFIX = "phoenix:session:"
+    INDEX_KEY = "phoenix:sessions"
+
+    # Logs from an absolute offset: the last (total - offset) kept entries,
+    # read atomically with the total so a concurrent trim cannot shift them
+    # Compare-and-set of status to "running"; ARGV = ttl, encoded "running", field/value pairs
+    _TRY_START_LUA = """
+    local status = redis.call('HGET', KEYS[1], 'status')
+    if not status or status == ARGV[2] then return 0 end
+    redis.call('HSET', KEYS[1], 'status', ARGV[2], unpack(ARGV, 3))
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+    return 1
+    """
+
+    _TAIL_LOGS_LUA = """
+    local total = tonumber(redis.call('GET', KEYS[2]) or '0')
+    local n = total - tonumber(ARGV[1])
+    if n <= 0 then return {total, {}} end
+    return {total, redis.call('LRANGE', KEYS[1], -n, -1)}
+    """
+
+    def __init__(self, url: str, ttl: int = SESSION_TTL, max_logs: int = MAX_LOGS):
+        self.redis = aioredis.from_url(url, decode_responses=True)
+        self.ttl = ttl
+        self.max_logs = max_logs
+        self._tail_logs = self.redis.register_script(self._TAIL_LOGS_LUA)
+        self._try_start = self.redis.register_script(self._TRY_START_LUA)
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.PREFIX}{session_id}"
+
+    def _logs_key(self, session_id: str) -> str:
+        return f"{self.PREFIX}{session_id}:logs"
+
+    def _log_count_key(self, session_id: str) -> str:
+        return f"{self.PREFIX}{session_id}:log_count"
+
+    @staticmethod
+    def _encode(fields: Dict[str, Any]) -> Dict[str, str]:
+        return {k: json.dumps(v, default=_json_default) for k, v in fields.items()}
+
+    @staticmethod
+    def _decode(raw: Dict[str, str]) -> Dict[str, Any]:
+        return {k: json.loads(v) for k, v in raw.items()}
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get session fields, or None if unknown or expired."""
+        raw = await self.redis.hgetall(self._key(session_id))
+        return self._decode(raw) if raw else None
+
+    async def set(self, session_id: str, data: Dict[str, Any]):
+        """Create or replace a session and reset its logs."""
+        key = self._key(session_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key, self._logs_key(session_id), self._log_count_key(session_id))
+            pipe.hset(key, mapping=self._encode(data))
+            pipe.expire(key, self.ttl)
+            pipe.sadd(self.INDEX_KEY, session_id)
+            await pipe.execute()
+
+    async def update(self, session_id: str, **fields):
+        """Update selected session fields."""
+        key = self._key(session_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=self._encode(fields))
+            pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+    async def try_start(self, session_id: str, **fields) -> bool:
+        """Atomically set status to "running" (plus fields) unless it already is."""
+        encoded = self._encode({**fields, "status": "running"})
+        running = encoded.pop("status")
+        pairs = [item for kv in encoded.items() for item in kv]
+        started = await self._try_start(keys=[self._key(session_id)], args=[self.ttl, running, *pairs])
+        return bool(started)
+
+    async def append_log(self, session_id: str, entry: Dict[str, Any]) -> int:
+        """Append one log entry to a session; returns the new log count."""
+        logs_key = self._logs_key(session_id)
+        count_key = self._log_count_key(session_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(logs_key, json.dumps(entry, default=_json_default))
+            pipe.ltrim(logs_key, -self.max_logs, -1)
+            pipe.incr(count_key)
+            pipe.expire(logs_key, self.ttl)
+            pipe.expire(count_key, self.ttl)
+            _, _, count, _, _ = await pipe.execute()
+        return count
+
+    async def clear_logs(self, session_id: str):
+        """Drop all logs of a session."""
+        await self.redis.delete(self._logs_key(session_id), self._log_count_key(session_id))
+
+    async def get_logs(self, session_id: str, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """Get kept logs from offset on, plus the total log count."""
+        total, raw = await self._tail_logs(
+            keys=[self._logs_key(session_id), self._log_count_key(session_id)], args=[offset]
+        )
+        return [json.loads(entry) for entry in raw], int(total)
+
+    async def log_count(self, session_id: str) -> int:
+        """Number of logs recorded for a session, including dropped ones."""
+        return int(await self.redis.get(self._log_count_key(session_id)) or 0)
+
+    async def list(self) -> List[Dict[str, Any]]:
+        """List all live sessions, pruning expired ones from the index."""
+        session_ids = sorted(await self.redis.smembers(self.INDEX_KEY))
+        if not session_ids:
+            return []
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.hgetall(self._key(session_id))
+            raws = await pipe.execute()
+
+        sessions, expired = [], []
+        for session_id, raw in zip(session_ids, raws):
+            if raw:
+                sessions.append(self._decode(raw))
+            else:
+                expired.append(session_id)
+        if expired:
+            await self.redis.srem(self.INDEX_KEY, *expired)
+        return sessions
+
+
+def _redacted_url(url: str) -> str:
+    """URL without its user/password part, for logging."""
+    parts = urlsplit(url)
+    if "@" not in parts.netloc:
+        return url
+    return url.replace(parts.netloc, parts.netloc.rpartition("@")[2], 1)
+
+
+def create_session_store():
+    """Create the configured session store (Redis if PHOENIX_REDIS_URL is set)."""
+    url = os.environ.get("PHOENIX_REDIS_URL")
+    if url:
+        if aioredis is not None:
+            logger.info("Using Redis session store at %s", _redacted_url(url))
+            return RedisSessionStore(url)
+        logger.warning("PHOENIX_REDIS_URL is set but redis is not installed; using in-memory sessions")
+    return MemorySessionStore()
+
+
+__all__ = [
+    'MemorySessionStore',
+    'RedisSessionStore',
+    'create_session_store',
+    'MAX_LOGS',
+    'SESSION_TTL'
+]
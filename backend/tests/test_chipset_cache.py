@@ -0,0 +1,47 @@
+import asyncio
+
+import server
+
+
+def test_cancelled_caller_does_not_cancel_shared_build():
+    calls = []
+
+    async def main():
+        release = asyncio.Event()
+
+        async def build():
+            calls.append(1)
+            await release.wait()
+            return {"chipset_id": "X"}
+
+        first = asyncio.create_task(server._cached("test:cancel", build))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(server._cached("test:cancel", build))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == {"chipset_id": "X"}
+        assert first.cancelled()
+        assert await server._cached("test:cancel", build) == {"chipset_id": "X"}
+
+    asyncio.run(main())
+    assert calls == [1]
+
+
+def test_none_results_are_not_cached():
+    calls = []
+
+    async def build():
+        calls.append(1)
+        return None
+
+    async def main():
+        await server._cached("test:none", build)
+        await asyncio.sleep(0)
+        await server._cached("test:none", build)
+
+    asyncio.run(main())
+    assert calls == [1, 1]
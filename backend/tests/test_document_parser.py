@@ -0,0 +1,65 @@
+import asyncio
+import threading
+
+from emulation_platform import DocumentParserWorker
+
+SPEC = """
+hardware:
+  soc: MT7986
+  vendor: mediatek
+capabilities:
+  - id: CAP_WIFI
+    name: WiFi 6E
+    category: network
+"""
+
+
+def test_cancelled_leader_does_not_cancel_coalesced_parse():
+    parser = DocumentParserWorker()
+    release = threading.Event()
+    parse_content = parser._parse_content
+
+    def slow_parse(ext, content):
+        release.wait(5)
+        return parse_content(ext, content)
+
+    parser._parse_content = slow_parse
+
+    async def main():
+        leader = asyncio.create_task(parser.parse_document("a.yaml", SPEC))
+        await asyncio.sleep(0.05)
+        follower = asyncio.create_task(parser.parse_document("b.yaml", SPEC))
+        await asyncio.sleep(0.05)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        doc = await follower
+        assert leader.cancelled()
+        assert doc["raw_parsed"]["hardware"]["soc"] == "MT7986"
+        # The shared parse finished and stays cached for later callers
+        assert (await parser.parse_document("c.yaml", SPEC))["raw_parsed"] == doc["raw_parsed"]
+
+    asyncio.run(main())
+
+
+def test_failed_parse_is_evicted():
+    parser = DocumentParserWorker()
+    calls = []
+
+    def failing_parse(ext, content):
+        calls.append(ext)
+        raise ValueError("boom")
+
+    parser._parse_content = failing_parse
+
+    async def main():
+        for _ in range(2):
+            try:
+                await parser.parse_document("a.yaml", SPEC)
+            except ValueError:
+                pass
+
+    asyncio.run(main())
+    assert len(calls) == 2
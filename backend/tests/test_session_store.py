@@ -0,0 +1,32 @@
+import asyncio
+
+from session_store import MemorySessionStore
+
+
+def test_try_start_is_compare_and_set():
+    async def main():
+        store = MemorySessionStore()
+        assert not await store.try_start("missing")
+
+        await store.set("s", {"status": "uploaded"})
+        started = await asyncio.gather(*(store.try_start("s", started_at="T") for _ in range(3)))
+        assert started == [True, False, False]
+        assert (await store.get("s"))["started_at"] == "T"
+
+        await store.update("s", status="completed")
+        assert await store.try_start("s", started_at="U")
+
+    asyncio.run(main())
+
+
+def test_logs_keep_absolute_offsets_when_bounded():
+    async def main():
+        store = MemorySessionStore(max_logs=3)
+        await store.set("s", {"status": "running"})
+        for i in range(5):
+            await store.append_log("s", {"i": i})
+        logs, total = await store.get_logs("s", 3)
+        assert [entry["i"] for entry in logs] == [3, 4]
+        assert total == 5
+
+    asyncio.run(main())
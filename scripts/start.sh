@@ -32,7 +32,11 @@ fi
 # Install backend dependencies if needed
 echo "Checking backend dependencies..."
 cd "$BACKEND_DIR"
-pip3 install -q fastapi uvicorn python-multipart pyyaml 2>/dev/null
+pip3 install -q fastapi uvicorn python-multipart pyyaml uvloop httptools orjson 2>/dev/null
+# PHOENIX_USE_GUNICORN=1 runs the backend as gunicorn + uvicorn workers (WORKERS / MAX_WORKERS)
+if [ -n "$PHOENIX_USE_GUNICORN" ]; then
+    pip3 install -q gunicorn 2>/dev/null
+fi
 
 # Install frontend dependencies if needed
 echo "Checking frontend dependencies..."